@@ -1,5 +1,10 @@
 """Configuration and preset scenarios."""
 
+import functools
+import sys
+
+import numpy as np
+
 from models import CelestialBody
 from utils import SOLAR_MASS, EARTH_MASS, JUPITER_MASS, AU
 
@@ -19,68 +24,141 @@ EUROPA_MASS = EARTH_MASS * 0.008
 GANYMEDE_MASS = EARTH_MASS * 0.025
 CALLISTO_MASS = EARTH_MASS * 0.018
 
+# Precomputed preset coordinates (m) and velocities (m/s)
+_MOON_X = AU + 3.844e8  # Moon orbits Earth at 384,400 km
+_MOON_VY = 29780 + 1022
+_JUPITER_X = 5.203 * AU
+_JUPITER_VY = 13070
+_IO_X = _JUPITER_X + 4.217e8
+_IO_VY = _JUPITER_VY + 17334
+_EUROPA_X = _JUPITER_X + 6.709e8
+_EUROPA_VY = _JUPITER_VY + 13740
+_GANYMEDE_X = _JUPITER_X + 1.0704e9
+_GANYMEDE_VY = _JUPITER_VY + 10880
+_CALLISTO_X = _JUPITER_X + 1.8827e9
+_CALLISTO_VY = _JUPITER_VY + 8204
+_BINARY_HALF_SEPARATION = 0.5 * AU
+
+
+def _materialize(specs):
+    """
+    Build fresh CelestialBody instances from preset spec tuples.
+    
+    Specs are (name, mass, x, y, vx, vy, color) tuples matching the
+    CelestialBody constructor. Bodies are mutated by the simulation, so only
+    the specs are cached and a new list is built on every load.
+    """
+    return [CelestialBody(*spec) for spec in specs]
+
+
+@functools.lru_cache(maxsize=None)
+def specs_to_arrays(specs):
+    """
+    Convert preset spec tuples to struct-of-arrays form.
+    
+    Returns:
+        Dict with read-only 'mass' (N,), 'pos' (N, 2) and 'vel' (N, 2)
+        float64 arrays plus parallel 'names' and 'colors' tuples
+    """
+    names, masses, xs, ys, vxs, vys, colors = zip(*specs)
+    arrays = {
+        'mass': np.array(masses, dtype=np.float64),
+        'pos': np.column_stack((xs, ys)).astype(np.float64),
+        'vel': np.column_stack((vxs, vys)).astype(np.float64),
+    }
+    # Results are cached and shared between loads, so guard against mutation
+    for arr in arrays.values():
+        arr.setflags(write=False)
+    arrays['names'] = names
+    arrays['colors'] = colors
+    return arrays
+
 
 class ScenarioPresets:
-    """Predefined simulation scenarios."""
+    """
+    Predefined simulation scenarios.
+    
+    Each scenario has a cached ``*_specs`` factory returning immutable
+    (name, mass, x, y, vx, vy, color) tuples, and a convenience method of the
+    same base name that materializes fresh CelestialBody objects from them.
+    """
     
     @staticmethod
-    def solar_system():
+    @functools.lru_cache(maxsize=None)
+    def solar_system_specs():
         """Complete Solar System with all 8 planets and Earth's moon."""
-        sun = CelestialBody("Sun", SOLAR_MASS, 0, 0, 0, 0, "#FDB813")
+        sun = ("Sun", SOLAR_MASS, 0, 0, 0, 0, "#FDB813")
         
-        mercury = CelestialBody("Mercury", MERCURY_MASS, 
-                               0.387*AU, 0, 0, 47870, "#8C7853")
-        venus = CelestialBody("Venus", VENUS_MASS, 
-                             0.723*AU, 0, 0, 35020, "#FFC649")
-        earth = CelestialBody("Earth", EARTH_MASS, 
-                             1.0*AU, 0, 0, 29780, "#4A90E2")
-        moon = CelestialBody("Moon", MOON_MASS, 
-                            1.0*AU + 3.844e8, 0, 0, 29780 + 1022, "#CCCCCC")
-        mars = CelestialBody("Mars", MARS_MASS, 
-                            1.524*AU, 0, 0, 24070, "#E27B58")
-        jupiter = CelestialBody("Jupiter", JUPITER_MASS, 
-                               5.203*AU, 0, 0, 13070, "#C88B3A")
-        saturn = CelestialBody("Saturn", SATURN_MASS, 
-                              9.537*AU, 0, 0, 9690, "#F4D03F")
-        uranus = CelestialBody("Uranus", URANUS_MASS, 
-                              19.191*AU, 0, 0, 6800, "#4FC3F7")
-        neptune = CelestialBody("Neptune", NEPTUNE_MASS, 
-                               30.069*AU, 0, 0, 5430, "#5C6BC0")
+        mercury = ("Mercury", MERCURY_MASS, 
+                   0.387*AU, 0, 0, 47870, "#8C7853")
+        venus = ("Venus", VENUS_MASS, 
+                 0.723*AU, 0, 0, 35020, "#FFC649")
+        earth = ("Earth", EARTH_MASS, 
+                 1.0*AU, 0, 0, 29780, "#4A90E2")
+        moon = ("Moon", MOON_MASS, 
+                _MOON_X, 0, 0, _MOON_VY, "#CCCCCC")
+        mars = ("Mars", MARS_MASS, 
+                1.524*AU, 0, 0, 24070, "#E27B58")
+        jupiter = ("Jupiter", JUPITER_MASS, 
+                   _JUPITER_X, 0, 0, _JUPITER_VY, "#C88B3A")
+        saturn = ("Saturn", SATURN_MASS, 
+                  9.537*AU, 0, 0, 9690, "#F4D03F")
+        uranus = ("Uranus", URANUS_MASS, 
+                  19.191*AU, 0, 0, 6800, "#4FC3F7")
+        neptune = ("Neptune", NEPTUNE_MASS, 
+                   30.069*AU, 0, 0, 5430, "#5C6BC0")
         
-        return [sun, mercury, venus, earth, moon, mars, jupiter, saturn, uranus, neptune]
+        return (sun, mercury, venus, earth, moon, mars, jupiter, saturn, uranus, neptune)
     
     @staticmethod
-    def earth_moon():
+    def solar_system():
+        """Complete Solar System with all 8 planets and Earth's moon."""
+        return _materialize(ScenarioPresets.solar_system_specs())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def earth_moon_specs():
         """Earth-Moon system orbiting the Sun."""
-        sun = CelestialBody("Sun", SOLAR_MASS, 0, 0, 0, 0, "#FDB813")
-        earth = CelestialBody("Earth", EARTH_MASS, AU, 0, 0, 29780, "#4A90E2")
+        sun = ("Sun", SOLAR_MASS, 0, 0, 0, 0, "#FDB813")
+        earth = ("Earth", EARTH_MASS, AU, 0, 0, 29780, "#4A90E2")
         # Moon orbits Earth at 384,400 km
-        moon = CelestialBody("Moon", MOON_MASS, 
-                            AU + 3.844e8, 0, 0, 29780 + 1022, "#CCCCCC")
-        return [sun, earth, moon]
+        moon = ("Moon", MOON_MASS, 
+                _MOON_X, 0, 0, _MOON_VY, "#CCCCCC")
+        return (sun, earth, moon)
     
     @staticmethod
-    def jupiter_moons():
+    def earth_moon():
+        """Earth-Moon system orbiting the Sun."""
+        return _materialize(ScenarioPresets.earth_moon_specs())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def jupiter_moons_specs():
         """Jupiter with its 4 Galilean moons (Io, Europa, Ganymede, Callisto)."""
-        sun = CelestialBody("Sun", SOLAR_MASS, 0, 0, 0, 0, "#FDB813")
-        jupiter = CelestialBody("Jupiter", JUPITER_MASS, 
-                               5.203*AU, 0, 0, 13070, "#C88B3A")
+        sun = ("Sun", SOLAR_MASS, 0, 0, 0, 0, "#FDB813")
+        jupiter = ("Jupiter", JUPITER_MASS, 
+                   _JUPITER_X, 0, 0, _JUPITER_VY, "#C88B3A")
         
         # Galilean moons with velocities relative to Jupiter
-        jupiter_v = 13070
-        io = CelestialBody("Io", IO_MASS, 
-                          5.203*AU + 4.217e8, 0, 0, jupiter_v + 17334, "#FFF59D")
-        europa = CelestialBody("Europa", EUROPA_MASS, 
-                              5.203*AU + 6.709e8, 0, 0, jupiter_v + 13740, "#BCAAA4")
-        ganymede = CelestialBody("Ganymede", GANYMEDE_MASS, 
-                                5.203*AU + 1.0704e9, 0, 0, jupiter_v + 10880, "#E0E0E0")
-        callisto = CelestialBody("Callisto", CALLISTO_MASS, 
-                                5.203*AU + 1.8827e9, 0, 0, jupiter_v + 8204, "#9E9E9E")
+        io = ("Io", IO_MASS, 
+              _IO_X, 0, 0, _IO_VY, "#FFF59D")
+        europa = ("Europa", EUROPA_MASS, 
+                  _EUROPA_X, 0, 0, _EUROPA_VY, "#BCAAA4")
+        ganymede = ("Ganymede", GANYMEDE_MASS, 
+                    _GANYMEDE_X, 0, 0, _GANYMEDE_VY, "#E0E0E0")
+        callisto = ("Callisto", CALLISTO_MASS, 
+                    _CALLISTO_X, 0, 0, _CALLISTO_VY, "#9E9E9E")
         
-        return [sun, jupiter, io, europa, ganymede, callisto]
+        return (sun, jupiter, io, europa, ganymede, callisto)
     
     @staticmethod
-    def three_body_problem():
+    def jupiter_moons():
+        """Jupiter with its 4 Galilean moons (Io, Europa, Ganymede, Callisto)."""
+        return _materialize(ScenarioPresets.jupiter_moons_specs())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def three_body_problem_specs():
         """
         Three-Body Problem: Triple star system with a planet (Liu Cixin inspired).
         Hierarchical triple system with planet in stable P-type orbit around binary.
@@ -88,67 +166,88 @@ class ScenarioPresets:
         # Close binary pair (Alpha and Beta) - tighter orbit for more stability
         # Circular orbit around common center of mass
         
-        alpha = CelestialBody("Alpha", SOLAR_MASS * 1.0, 
-                             -0.3*AU, 0, 0, -30000, "#FDB813")
-        beta = CelestialBody("Beta", SOLAR_MASS * 1.0, 
-                            0.3*AU, 0, 0, 30000, "#FF6B35")
+        alpha = ("Alpha", SOLAR_MASS * 1.0, 
+                 -0.3*AU, 0, 0, -30000, "#FDB813")
+        beta = ("Beta", SOLAR_MASS * 1.0, 
+                0.3*AU, 0, 0, 30000, "#FF6B35")
         
         # Distant third star (Gamma) in wide orbit - provides chaotic perturbations
         # Much further out to avoid disrupting the planet
-        gamma = CelestialBody("Gamma", SOLAR_MASS * 0.8, 
-                             0, 6.0*AU, -6500, 0, "#FF0000")
+        gamma = ("Gamma", SOLAR_MASS * 0.8, 
+                 0, 6.0*AU, -6500, 0, "#FF0000")
         
         # Planet in P-type circumbinary orbit around Alpha-Beta pair
         # Positioned well outside the binary (>3x separation) for Hill stability
         # Velocity calculated for roughly circular orbit around binary center
-        planet = CelestialBody("Trisolaris", EARTH_MASS * 2.0, 
-                              2.2*AU, 0, 0, 22000, "#4A90E2")
+        planet = ("Trisolaris", EARTH_MASS * 2.0, 
+                  2.2*AU, 0, 0, 22000, "#4A90E2")
         
-        return [alpha, beta, gamma, planet]
+        return (alpha, beta, gamma, planet)
     
     @staticmethod
-    def alpha_centauri():
+    def three_body_problem():
+        """Three-Body Problem: Triple star system with a planet (Liu Cixin inspired)."""
+        return _materialize(ScenarioPresets.three_body_problem_specs())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def alpha_centauri_specs():
         """
         Alpha Centauri: Triple star system (Alpha Cen A, B, and Proxima).
         A and B are binary, Proxima orbits distantly.
         """
         # Alpha Centauri A and B binary system
-        alpha_a = CelestialBody("Alpha Cen A", SOLAR_MASS * 1.1, 
-                               -11.2*AU, 0, 0, -22000, "#FFF9C4")
-        alpha_b = CelestialBody("Alpha Cen B", SOLAR_MASS * 0.907, 
-                               11.8*AU, 0, 0, 23000, "#FFE082")
+        alpha_a = ("Alpha Cen A", SOLAR_MASS * 1.1, 
+                   -11.2*AU, 0, 0, -22000, "#FFF9C4")
+        alpha_b = ("Alpha Cen B", SOLAR_MASS * 0.907, 
+                   11.8*AU, 0, 0, 23000, "#FFE082")
         
         # Proxima Centauri - distant red dwarf companion
-        proxima = CelestialBody("Proxima Cen", SOLAR_MASS * 0.123, 
-                               0, 8000*AU, -500, 0, "#EF5350")
+        proxima = ("Proxima Cen", SOLAR_MASS * 0.123, 
+                   0, 8000*AU, -500, 0, "#EF5350")
         
-        return [alpha_a, alpha_b, proxima]
+        return (alpha_a, alpha_b, proxima)
     
     @staticmethod
-    def figure_8():
+    def alpha_centauri():
+        """Alpha Centauri: Triple star system (Alpha Cen A, B, and Proxima)."""
+        return _materialize(ScenarioPresets.alpha_centauri_specs())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def figure_8_specs():
         """Figure-8 choreography - stable three-body periodic orbit."""
         mass = SOLAR_MASS
-        bodies = [
-            CelestialBody("Body 1", mass, -1.0*AU, 0, 0, -15000, "#FDB813"),
-            CelestialBody("Body 2", mass, 1.0*AU, 0, 0, 17500, "#FF6B35"),
-            CelestialBody("Body 3", mass, 0, 1.5*AU, -20000, 0, "#FF0000"),
-        ]
-        return bodies
+        return (
+            ("Body 1", mass, -1.0*AU, 0, 0, -15000, "#FDB813"),
+            ("Body 2", mass, 1.0*AU, 0, 0, 17500, "#FF6B35"),
+            ("Body 3", mass, 0, 1.5*AU, -20000, 0, "#FF0000"),
+        )
     
     @staticmethod
-    def binary_stars():
+    def figure_8():
+        """Figure-8 choreography - stable three-body periodic orbit."""
+        return _materialize(ScenarioPresets.figure_8_specs())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def binary_stars_specs():
         """Binary star system with equal mass stars."""
         mass = SOLAR_MASS
-        separation = 1.0 * AU
         velocity = 25000
         
-        star1 = CelestialBody("Star A", mass, -separation/2, 0, 0, -velocity, "#FDB813")
-        star2 = CelestialBody("Star B", mass, separation/2, 0, 0, velocity, "#FF6B35")
-        return [star1, star2]
+        star1 = ("Star A", mass, -_BINARY_HALF_SEPARATION, 0, 0, -velocity, "#FDB813")
+        star2 = ("Star B", mass, _BINARY_HALF_SEPARATION, 0, 0, velocity, "#FF6B35")
+        return (star1, star2)
+    
+    @staticmethod
+    def binary_stars():
+        """Binary star system with equal mass stars."""
+        return _materialize(ScenarioPresets.binary_stars_specs())
 
 
-# Color palette for bodies
-COLOR_PALETTE = [
+# Color palette for bodies (immutable, interned strings)
+COLOR_PALETTE = tuple(sys.intern(color) for color in (
     "#FDB813",  # Golden yellow (sun-like)
     "#FF6B35",  # Orange
     "#FF0000",  # Red
@@ -159,7 +258,7 @@ COLOR_PALETTE = [
     "#00FFFF",  # Cyan
     "#C88B3A",  # Brown (jupiter-like)
     "#CCCCCC",  # Gray (moon-like)
-]
+))
 
 
 # Default simulation parameters
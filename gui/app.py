@@ -1,20 +1,28 @@
 """Main application class that orchestrates all GUI components."""
 
+import time
 import tkinter as tk
 from tkinter import ttk
 
 from models import SimulationState, CelestialBody
-from models.simulation_state import SimulationMode
-from config.presets import ScenarioPresets
+from models.simulation_state import SimulationMode, POSITIONS_DIRTY
 from .canvas import SimulationCanvas
 from .control_panel import ControlPanel
 from .body_editor import BodyEditorPanel
-from .preset_menu import PresetMenu
+
+# Enum members are singletons; bind once for identity checks in the frame loop
+_SIM_MODE = SimulationMode.SIMULATION_MODE
 
 
 class NBodyApp:
     """Main N-Body simulation application."""
     
+    # Preset ID -> cached spec factory, populated by _get_preset_map
+    _PRESET_MAP = None
+    
+    # ttk styles are global to the Tk interpreter; register them only once
+    _styles_configured = False
+    
     def __init__(self, root: tk.Tk):
         """
         Initialize the application.
@@ -27,8 +35,7 @@ class NBodyApp:
         self.root.geometry("1600x900")
         
         # Configure button styles
-        style = ttk.Style()
-        style.configure('Active.TButton', background='#4A90E2', foreground='white')
+        self._configure_styles()
         
         # Shared simulation state
         self.state = SimulationState()
@@ -36,16 +43,17 @@ class NBodyApp:
         # Create UI components
         self.control_panel = ControlPanel(self.root, self.state)
         
-        # Add preset menu to control panel frame
+        # Add preset menu to control panel frame (imported here so the
+        # module is only loaded when the window is actually built)
+        from .preset_menu import PresetMenu
         self.preset_menu = PresetMenu(self.control_panel.frame)
         
         # Main content area
         content_frame = ttk.Frame(self.root)
         content_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Body editor on the left - always show in God Mode
+        # Body editor on the left - built and shown on demand in God Mode
         self.body_editor = BodyEditorPanel(content_frame, self.state)
-        self.body_editor.show()  # Make it visible by default
         
         # Canvas in the center/right
         self.canvas = SimulationCanvas(content_frame, self.state)
@@ -53,11 +61,26 @@ class NBodyApp:
         # Connect callbacks
         self.setup_callbacks()
         
-        # Animation loop
+        # Animation loop (cache the scheduler to avoid a lookup per frame)
+        self._after = self.root.after
+        self._loop_scheduled = False
         self.animation_running = False
         self.animation_steps_per_frame = 10
+        self.step_budget = 0.020  # seconds of physics per frame
+        self._avg_step_time = 0.0  # EWMA of seconds per simulation step
+        self._last_render = 0.0
+        self._last_time_update = 0.0
         self.start_animation_loop()
     
+    @classmethod
+    def _configure_styles(cls):
+        """Register custom ttk styles on first app creation."""
+        if cls._styles_configured:
+            return
+        style = ttk.Style()
+        style.configure('Active.TButton', background='#4A90E2', foreground='white')
+        cls._styles_configured = True
+    
     def setup_callbacks(self):
         """Setup callbacks between components."""
         # Canvas callbacks
@@ -69,6 +92,7 @@ class NBodyApp:
         # Control panel callbacks
         self.control_panel.on_mode_change = self.on_mode_change
         self.control_panel.on_clear_all = self.clear_all_bodies
+        self.control_panel.on_play_pause = self._wake_loop
         
         # Body editor callbacks
         self.body_editor.on_body_updated = self.on_body_updated
@@ -93,6 +117,9 @@ class NBodyApp:
     
     def on_body_updated(self):
         """Handle body updates from editor."""
+        # Mass edits already bumped masses_version in the editor; anything
+        # else only needs the markers, labels and arrow refreshed
+        self.state.dirty |= POSITIONS_DIRTY
         self.canvas.render()
     
     def on_mode_change(self):
@@ -107,6 +134,7 @@ class NBodyApp:
             self.body_editor.set_body(None)
         
         self.canvas.render()
+        self._wake_loop()
     
     def clear_all_bodies(self):
         """Clear all bodies from the simulation."""
@@ -116,7 +144,7 @@ class NBodyApp:
         self.body_editor.set_body(None)
         
         # Turn off velocity arrow mode if it was on
-        self.canvas.velocity_arrow = None
+        self.canvas.clear_velocity_arrow()
         self.canvas.is_dragging_arrow = False
         
         self.canvas.render()
@@ -172,27 +200,37 @@ class NBodyApp:
                     self.control_panel.capture_all_button.config(style='TButton')
                     break
     
+    @classmethod
+    def _get_preset_map(cls) -> dict:
+        """Return the preset ID -> spec factory table, building it on first use."""
+        if cls._PRESET_MAP is None:
+            # Deferred import: preset construction code is only needed once a
+            # preset is actually chosen
+            from config.presets import ScenarioPresets
+            
+            cls._PRESET_MAP = {
+                'solar_system': ScenarioPresets.solar_system_specs,
+                'earth_moon': ScenarioPresets.earth_moon_specs,
+                'jupiter_moons': ScenarioPresets.jupiter_moons_specs,
+                'three_body_problem': ScenarioPresets.three_body_problem_specs,
+                'alpha_centauri': ScenarioPresets.alpha_centauri_specs,
+                'binary_stars': ScenarioPresets.binary_stars_specs,
+                'figure_8': ScenarioPresets.figure_8_specs,
+            }
+        return cls._PRESET_MAP
+    
     def load_preset(self, preset_id: str):
         """Load a preset configuration."""
-        # Map preset IDs to methods
-        preset_map = {
-            'solar_system': ScenarioPresets.solar_system,
-            'earth_moon': ScenarioPresets.earth_moon,
-            'jupiter_moons': ScenarioPresets.jupiter_moons,
-            'three_body_problem': ScenarioPresets.three_body_problem,
-            'alpha_centauri': ScenarioPresets.alpha_centauri,
-            'binary_stars': ScenarioPresets.binary_stars,
-            'figure_8': ScenarioPresets.figure_8,
-        }
-        
-        if preset_id in preset_map:
+        factory = self._get_preset_map().get(preset_id)
+        
+        if factory:
+            from config.presets import specs_to_arrays
+            
             # Clear existing bodies
             self.state.clear_all()
             
-            # Load preset bodies
-            bodies = preset_map[preset_id]()
-            for body in bodies:
-                self.state.add_body(body)
+            # Load preset bodies straight from cached struct-of-arrays data
+            self.state.add_bodies_soa(specs_to_arrays(factory()))
             
             # Reset view and render
             self.canvas.reset_view()
@@ -212,30 +250,51 @@ class NBodyApp:
     
     def animation_loop(self):
         """Main animation loop for simulation updates."""
+        self._loop_scheduled = False
         if not self.animation_running:
             return
         
         # If in simulation mode and running, step the simulation
-        if self.state.mode == SimulationMode.SIMULATION_MODE and self.state.is_running:
-            # Calculate steps based on time warp
-            steps = int(self.animation_steps_per_frame * self.state.time_warp)
-            steps = max(1, min(steps, 1000))  # Clamp between 1 and 1000
+        if self.state.mode is _SIM_MODE and self.state.is_running:
+            # Calculate steps based on time warp, then back off so the physics
+            # fits in the frame budget and the Tk event loop stays responsive
+            requested = max(1, int(self.animation_steps_per_frame * self.state.time_warp))
+            if self._avg_step_time > 0:
+                steps = max(1, min(requested, int(self.step_budget / self._avg_step_time)))
+            else:
+                # No measurement yet, start with a modest batch
+                steps = min(requested, self.animation_steps_per_frame)
             
-            for _ in range(steps):
-                self.state.step_simulation()
+            t0 = time.perf_counter()
+            self.state.step_simulation_n(steps)
+            step_time = (time.perf_counter() - t0) / steps
+            if self._avg_step_time > 0:
+                self._avg_step_time = 0.8 * self._avg_step_time + 0.2 * step_time
+            else:
+                self._avg_step_time = step_time
             
-            # Update display
-            self.canvas.render()
-            self.control_panel.update_time_display()
+            now = time.monotonic()
+            
+            # Update display, only when something changed and at most ~60 FPS
+            if self.state.dirty and now - self._last_render >= 0.016:
+                self.canvas.render()
+                self._last_render = now
+            
+            # A clock readout doesn't need more than ~4 updates per second
+            if now - self._last_time_update > 0.25:
+                self.control_panel.update_time_display()
+                self._last_time_update = now
             
             # Schedule next frame (30 FPS target)
-            delay = 33
-        else:
-            # Slower update when not running
-            delay = 100
-        
-        # Use a lambda to avoid method reference issues
-        self.root.after(delay, lambda: self.animation_loop())
+            self._loop_scheduled = True
+            self._after(33, self.animation_loop)
+        # Otherwise go idle; _wake_loop restarts us when the simulation runs
+    
+    def _wake_loop(self):
+        """Restart the animation loop if it went idle."""
+        if self.animation_running and not self._loop_scheduled:
+            self._loop_scheduled = True
+            self._after(0, self.animation_loop)
     
     def run(self):
         """Run the application."""
@@ -1,11 +1,45 @@
 """Body editor panel for modifying body properties in God Mode."""
 
+import contextlib
+import dataclasses
+import functools
+import math
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional
 
 from models import CelestialBody, SimulationState
-from utils import calculate_orbital_velocity_vector, G, SOLAR_MASS, EARTH_MASS, JUPITER_MASS
+from utils import G, SOLAR_MASS, EARTH_MASS, JUPITER_MASS
+
+
+# Any prefix of a decimal float literal, so entries accept input key by key
+_PARTIAL_FLOAT_RE = re.compile(r'[+-]?(?:(?:\d+\.?\d*|\.\d*)(?:[eE][+-]?\d*)?)?')
+
+
+# Memoized number formatting for update_display; a paused or slow-moving
+# simulation keeps asking for the same values
+@functools.lru_cache(maxsize=4096)
+def _fmt_e3(value: float) -> str:
+    return f"{value:.3e}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_e2(value: float) -> str:
+    return f"{value:.2e}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_f2(value: float) -> str:
+    return f"{value:.2f}"
+
+
+@dataclasses.dataclass
+class _OrbitCtx:
+    """Cached inputs for placing one body in orbit around another."""
+    orbiter: CelestialBody
+    target: CelestialBody
+    mu: float  # G * (M + m)
 
 
 class BodyEditorPanel:
@@ -25,41 +59,62 @@ class BodyEditorPanel:
         
         # Callback for when body is updated
         self.on_body_updated = None
+        self._update_pending = False
+        self._edit_depth = 0  # nesting level of _batched()
+        self._edit_dirty = False
+        self._status_job = None
+        
+        # Last strings written to the display widgets (see update_display)
+        self._last = {}
+        
+        # Whether a body is shown, and the values it was last displayed with
+        self._visible = False
+        self._last_body_snapshot = None
+        
+        # Speed last applied through apply_velocity_magnitude
+        self._cached_mag: Optional[float] = None
         
         # Auto-orbit state
         self.auto_orbit_enabled = False
         self.auto_orbit_target: Optional[CelestialBody] = None
         self.is_selecting_orbit_target = False  # New flag for target selection mode
+        self._orbit_ctx: Optional[_OrbitCtx] = None  # dropped whenever a mass changes
         
-        # Create frame
-        self.frame = ttk.Frame(parent, padding="10", relief=tk.RIDGE, borderwidth=2)
+        # Two-click delete confirmation
+        self._delete_armed = False
+        self._delete_job = None
         
-        self.create_widgets()
-        self.show()
+        # Create frame; its widgets are built on the first set_body(body)
+        self.frame = ttk.Frame(parent, padding="10", relief=tk.RIDGE, borderwidth=2)
+        self._built = False
     
     def create_widgets(self):
         """Create editor widgets."""
         # Title
         title = ttk.Label(self.frame, text="Body Editor", 
                          font=("Arial", 14, "bold"))
-        title.pack(pady=10)
+        title.grid(row=0, column=0, pady=10)
         
         self.no_selection_label = ttk.Label(self.frame, 
                                             text="No body selected\n\nClick a body or\nclick canvas to add one",
                                             font=("Arial", 10), justify=tk.CENTER)
-        self.no_selection_label.pack(pady=20)
+        self.no_selection_label.grid(row=1, column=0, pady=20)
         
-        # Editor content frame (hidden until body selected)
+        # Editor content frame (hidden until body selected). The two frames
+        # share the grid so that toggling is a grid_remove/grid pair.
         self.editor_frame = ttk.Frame(self.frame)
+        self.editor_frame.grid(row=2, column=0, sticky="new")
+        self.editor_frame.grid_remove()
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(2, weight=1)
         
         # Name
         name_frame = ttk.LabelFrame(self.editor_frame, text="Name", padding="5")
         name_frame.pack(fill=tk.X, pady=5)
         
-        self.name_var = tk.StringVar()
-        self.name_entry = ttk.Entry(name_frame, textvariable=self.name_var, font=("Arial", 11))
+        self.name_entry = ttk.Entry(name_frame, font=("Arial", 11))
         self.name_entry.pack(fill=tk.X)
-        self.name_entry.bind('<Return>', lambda e: self.apply_changes())
+        self.name_entry.bind('<Return>', self._on_return_apply_changes)
         
         # Mass
         mass_frame = ttk.LabelFrame(self.editor_frame, text="Mass", padding="5")
@@ -68,10 +123,12 @@ class BodyEditorPanel:
         mass_input_frame = ttk.Frame(mass_frame)
         mass_input_frame.pack(fill=tk.X)
         
-        self.mass_var = tk.StringVar()
-        self.mass_entry = ttk.Entry(mass_input_frame, textvariable=self.mass_var, width=15)
+        # Reject non-numeric keystrokes up front; Apply then rarely hits the error path
+        vcmd = (self.frame.register(self._validate_float), '%P')
+        self.mass_entry = ttk.Entry(mass_input_frame, width=15,
+                                    validate='key', validatecommand=vcmd)
         self.mass_entry.pack(side=tk.LEFT, padx=2)
-        self.mass_entry.bind('<Return>', lambda e: self.apply_changes())
+        self.mass_entry.bind('<Return>', self._on_return_apply_changes)
         
         ttk.Label(mass_input_frame, text="kg").pack(side=tk.LEFT)
         
@@ -79,12 +136,9 @@ class BodyEditorPanel:
         preset_frame = ttk.Frame(mass_frame)
         preset_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Button(preset_frame, text="Earth", width=8,
-                  command=lambda: self.set_mass_preset(EARTH_MASS)).pack(side=tk.LEFT, padx=2)
-        ttk.Button(preset_frame, text="Jupiter", width=8,
-                  command=lambda: self.set_mass_preset(JUPITER_MASS)).pack(side=tk.LEFT, padx=2)
-        ttk.Button(preset_frame, text="Sun", width=8,
-                  command=lambda: self.set_mass_preset(SOLAR_MASS)).pack(side=tk.LEFT, padx=2)
+        for label, mass in (("Earth", EARTH_MASS), ("Jupiter", JUPITER_MASS), ("Sun", SOLAR_MASS)):
+            ttk.Button(preset_frame, text=label, width=8,
+                      command=functools.partial(self.set_mass_preset, mass)).pack(side=tk.LEFT, padx=2)
         
         # Position (read-only display)
         pos_frame = ttk.LabelFrame(self.editor_frame, text="Position", padding="5")
@@ -96,16 +150,20 @@ class BodyEditorPanel:
         # Velocity section
         velocity_frame = ttk.LabelFrame(self.editor_frame, text="Velocity", padding="5")
         velocity_frame.pack(fill=tk.X, pady=5)
+        velocity_frame.columnconfigure(0, weight=1)
         
         # Auto-orbit option
         self.auto_orbit_var = tk.BooleanVar(value=False)
         auto_orbit_check = ttk.Checkbutton(velocity_frame, text="Auto Orbit", 
                                           variable=self.auto_orbit_var,
                                           command=self.toggle_auto_orbit)
-        auto_orbit_check.pack(anchor=tk.W, pady=2)
+        auto_orbit_check.grid(row=0, column=0, sticky="w", pady=2)
         
-        # Auto-orbit controls
+        # Auto-orbit controls (row 1) and manual velocity (row 2) are mutually
+        # exclusive; grid_remove keeps each frame's slot for a cheap re-show
         self.auto_orbit_frame = ttk.Frame(velocity_frame)
+        self.auto_orbit_frame.grid(row=1, column=0, sticky="ew", pady=5)
+        self.auto_orbit_frame.grid_remove()
         
         ttk.Label(self.auto_orbit_frame, 
                  text="Click another body to orbit:").pack(anchor=tk.W)
@@ -118,10 +176,9 @@ class BodyEditorPanel:
         orbit_buttons = ttk.Frame(self.auto_orbit_frame)
         orbit_buttons.pack(fill=tk.X, pady=5)
         
-        ttk.Button(orbit_buttons, text="Select Target", 
-                  command=self.start_orbit_selection).pack(side=tk.LEFT, padx=2)
-        ttk.Button(orbit_buttons, text="Apply Orbit", 
-                  command=self.apply_auto_orbit).pack(side=tk.LEFT, padx=2)
+        for label, command in (("Select Target", self.start_orbit_selection),
+                               ("Apply Orbit", self.apply_auto_orbit)):
+            ttk.Button(orbit_buttons, text=label, command=command).pack(side=tk.LEFT, padx=2)
         
         # Direction option
         self.orbit_clockwise_var = tk.BooleanVar(value=False)
@@ -130,7 +187,7 @@ class BodyEditorPanel:
         
         # Manual velocity
         self.manual_vel_frame = ttk.Frame(velocity_frame)
-        self.manual_vel_frame.pack(fill=tk.X, pady=5)
+        self.manual_vel_frame.grid(row=2, column=0, sticky="ew", pady=5)
         
         # Velocity display
         self.vel_label = ttk.Label(self.manual_vel_frame, text="vx: 0.00 m/s\nvy: 0.00 m/s")
@@ -141,11 +198,12 @@ class BodyEditorPanel:
         vel_input_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(vel_input_frame, text="Speed:").pack(side=tk.LEFT, padx=2)
-        self.velocity_magnitude_var = tk.StringVar(value="0")
-        self.velocity_entry = ttk.Entry(vel_input_frame, textvariable=self.velocity_magnitude_var, width=12)
+        self.velocity_entry = ttk.Entry(vel_input_frame, width=12,
+                                        validate='key', validatecommand=vcmd)
+        self.velocity_entry.insert(0, "0")
         self.velocity_entry.pack(side=tk.LEFT, padx=2)
         ttk.Label(vel_input_frame, text="m/s").pack(side=tk.LEFT, padx=2)
-        self.velocity_entry.bind('<Return>', lambda e: self.apply_velocity_magnitude())
+        self.velocity_entry.bind('<Return>', self._on_return_apply_velocity)
         
         # Velocity arrow buttons
         vel_button_frame = ttk.Frame(self.manual_vel_frame)
@@ -168,53 +226,188 @@ class BodyEditorPanel:
         
         ttk.Button(button_frame, text="Apply Changes", 
                   command=self.apply_changes).pack(side=tk.LEFT, padx=2, expand=True, fill=tk.X)
-        ttk.Button(button_frame, text="Delete Body", 
-                  command=self.delete_body).pack(side=tk.LEFT, padx=2, expand=True, fill=tk.X)
+        self.delete_button = ttk.Button(button_frame, text="Delete Body", 
+                  command=self.delete_body)
+        self.delete_button.pack(side=tk.LEFT, padx=2, expand=True, fill=tk.X)
+        
+        # Transient, non-blocking status messages (see _status)
+        self.status_label = ttk.Label(self.frame, text="", foreground="green",
+                                      font=("Arial", 9), wraplength=220, justify=tk.LEFT)
+        self.status_label.grid(row=3, column=0, sticky="sew", pady=5)
+    
+    @staticmethod
+    def _validate_float(text: str) -> bool:
+        """Tk validatecommand: accept text that is (the start of) a number."""
+        return _PARTIAL_FLOAT_RE.fullmatch(text) is not None
+    
+    def _focused_widget(self):
+        """Return the widget with keyboard focus, or None."""
+        try:
+            return self.frame.focus_get()
+        except KeyError:
+            # focus_get can't map some internal Tk widgets (e.g. combobox popdowns)
+            return None
+    
+    @staticmethod
+    def _set_entry(entry: ttk.Entry, text: str):
+        """Replace the text of an entry."""
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
+    
+    def _on_return_apply_changes(self, event):
+        """Apply name/mass edits when Return is pressed in an entry."""
+        self.apply_changes()
+    
+    def _on_return_apply_velocity(self, event):
+        """Apply the typed speed when Return is pressed in the speed entry."""
+        self.apply_velocity_magnitude()
+    
+    def _status(self, msg: str, color: str = "green", ms: int = 2500):
+        """
+        Show a transient message in the panel without blocking the event loop.
+        
+        Args:
+            msg: Text to display
+            color: Foreground color
+            ms: Time in milliseconds before the message is cleared
+        """
+        self.status_label.config(text=msg, foreground=color)
+        if self._status_job is not None:
+            self.frame.after_cancel(self._status_job)
+        self._status_job = self.frame.after(ms, self._clear_status)
+    
+    def _clear_status(self):
+        """Clear the status message."""
+        self._status_job = None
+        self.status_label.config(text="")
+    
+    @contextlib.contextmanager
+    def _batched(self):
+        """
+        Group several edits so they produce a single on_body_updated.
+        
+        Re-entrant; the update is scheduled when the outermost block exits.
+        """
+        self._edit_depth += 1
+        try:
+            yield
+        finally:
+            self._edit_depth -= 1
+            if self._edit_depth == 0 and self._edit_dirty:
+                self._edit_dirty = False
+                self._schedule_update()
+    
+    def _schedule_update(self):
+        """Schedule on_body_updated for the next idle point, coalescing bursts."""
+        if self._edit_depth:
+            self._edit_dirty = True
+            return
+        if not self._update_pending and self.on_body_updated:
+            self._update_pending = True
+            self.frame.after_idle(self._flush_update)
+    
+    def _flush_update(self):
+        """Run the pending on_body_updated callback."""
+        self._update_pending = False
+        if self.on_body_updated:
+            self.on_body_updated()
+    
+    def _ensure_built(self):
+        """Create and show the editor widgets the first time a body is edited."""
+        if self._built:
+            return
+        self.create_widgets()
+        self._built = True
+        self.show()
     
     def show(self):
-        """Show the editor panel."""
+        """Show the editor panel (no-op until its widgets are built)."""
+        if not self._built:
+            return
+        
         # Force pack with all parameters to ensure consistent positioning
         self.frame.pack_forget()  # Remove first to reset position
         self.frame.pack(side=tk.LEFT, fill=tk.Y, expand=False, anchor=tk.NW, padx=5, pady=5, before=self.parent.winfo_children()[1] if len(self.parent.winfo_children()) > 1 else None)
     
     def hide(self):
         """Hide the editor panel."""
-        self.frame.pack_forget()
+        if self._built:
+            self.frame.pack_forget()
     
     def set_body(self, body: Optional[CelestialBody]):
         """Set the body to edit."""
+        if self._delete_armed and body is not self.current_body:
+            self._disarm_delete()
         self.current_body = body
+        self._orbit_ctx = None
+        # Entries may hold unapplied user input; rewrite everything
+        self._last.clear()
+        self._last_body_snapshot = None
+        self._visible = body is not None
+        self._cached_mag = None
+        
+        if body is not None:
+            self._ensure_built()
+        elif not self._built:
+            return
         
         if body is None:
-            self.no_selection_label.pack(pady=20)
-            self.editor_frame.pack_forget()
+            self.editor_frame.grid_remove()
+            self.no_selection_label.grid()
         else:
-            self.no_selection_label.pack_forget()
-            self.editor_frame.pack(fill=tk.BOTH, expand=True)
+            self.no_selection_label.grid_remove()
+            self.editor_frame.grid()
             self.update_display()
     
     def update_display(self):
         """Update displayed values from current body."""
-        if self.current_body is None:
+        body = self.current_body
+        if not self._visible or body is None:
             return
         
-        # Update name
-        self.name_var.set(self.current_body.name)
-        
-        # Update mass
-        self.mass_var.set(f"{self.current_body.get_mass():.3e}")
-        
-        # Update position
-        x, y = self.current_body.get_position()
-        self.pos_label.config(text=f"x: {x:.3e} m\ny: {y:.3e} m")
-        
-        # Update velocity
-        vx, vy = self.current_body.get_velocity()
-        self.vel_label.config(text=f"vx: {vx:.2e} m/s\nvy: {vy:.2e} m/s")
-        
-        # Update velocity magnitude
-        magnitude = (vx**2 + vy**2)**0.5
-        self.velocity_magnitude_var.set(f"{magnitude:.2f}")
+        x, y = body.get_position()
+        vx, vy = body.get_velocity()
+        mass = body.get_mass()
+        snapshot = (body.uid, body.name, mass, x, y, vx, vy)
+        previous = self._last_body_snapshot
+        if snapshot == previous:
+            return
+        self._last_body_snapshot = snapshot
+        
+        magnitude = math.hypot(vx, vy)
+        if self._cached_mag is not None and math.isclose(magnitude, self._cached_mag):
+            magnitude = self._cached_mag  # show the speed exactly as entered
+        
+        name = body.name
+        mass_s = _fmt_e3(mass)
+        pos_s = f"x: {_fmt_e3(x)} m\ny: {_fmt_e3(y)} m"
+        vel_s = f"vx: {_fmt_e2(vx)} m/s\nvy: {_fmt_e2(vy)} m/s"
+        mag_s = _fmt_f2(magnitude)
+        
+        # Don't overwrite the entry the user is typing in; right after
+        # set_body (no previous snapshot) everything is rewritten
+        focused = self._focused_widget() if previous is not None else None
+        
+        # Only push strings that changed; each set/config is a Tcl round-trip
+        last = self._last
+        set_entry = self._set_entry
+        pos_cfg = self.pos_label.config
+        vel_cfg = self.vel_label.config
+        if last.get('name') != name and focused is not self.name_entry:
+            set_entry(self.name_entry, name)
+            last['name'] = name
+        if last.get('mass_s') != mass_s and focused is not self.mass_entry:
+            set_entry(self.mass_entry, mass_s)
+            last['mass_s'] = mass_s
+        if last.get('pos_s') != pos_s:
+            pos_cfg(text=pos_s)
+            last['pos_s'] = pos_s
+        if last.get('vel_s') != vel_s:
+            vel_cfg(text=vel_s)
+            last['vel_s'] = vel_s
+        if last.get('mag_s') != mag_s and focused is not self.velocity_entry:
+            set_entry(self.velocity_entry, mag_s)
+            last['mag_s'] = mag_s
     
     def apply_changes(self):
         """Apply changes to the current body."""
@@ -222,88 +415,128 @@ class BodyEditorPanel:
             return
         
         try:
-            # Update name
-            self.current_body.name = self.name_var.get()
+            body = self.current_body
+            new_name = self.name_entry.get()
             
-            # Update mass
-            mass_str = self.mass_var.get()
-            mass = float(mass_str)
-            if mass <= 0:
+            mass_str = self.mass_entry.get()
+            new_mass = float(mass_str)
+            if new_mass <= 0:
                 raise ValueError("Mass must be positive")
-            self.current_body.set_mass(mass)
             
-            if self.on_body_updated:
-                self.on_body_updated()
+            with self._batched():
+                # Update name
+                if new_name != body.name:
+                    body.name = new_name
+                    self._schedule_update()
+                
+                # Update mass; the entry shows a rounded value, so text that is
+                # still exactly what update_display wrote counts as unchanged
+                if (mass_str != self._last.get('mass_s')
+                        and not math.isclose(new_mass, body.get_mass(), rel_tol=1e-12)):
+                    body.set_mass(new_mass)
+                    self.state.mark_mass_dirty()
+                    self._last['mass_s'] = mass_str
+                    self._orbit_ctx = None
+                    self._schedule_update()
                 
         except ValueError as e:
             messagebox.showerror("Invalid Input", f"Error: {e}")
     
     def set_mass_preset(self, mass: float):
         """Set mass to a preset value."""
-        self.mass_var.set(f"{mass:.3e}")
-        self.apply_changes()
+        if self.current_body is None:
+            return
+        
+        self.current_body.set_mass(mass)
+        self.state.mark_mass_dirty()
+        self._orbit_ctx = None
+        mass_s = _fmt_e3(mass)
+        self._set_entry(self.mass_entry, mass_s)
+        self._last['mass_s'] = mass_s
+        self._schedule_update()
     
     def toggle_auto_orbit(self):
         """Toggle auto-orbit mode."""
         self.auto_orbit_enabled = self.auto_orbit_var.get()
         
         if self.auto_orbit_enabled:
-            self.auto_orbit_frame.pack(fill=tk.X, pady=5)
-            self.manual_vel_frame.pack_forget()
+            self.manual_vel_frame.grid_remove()
+            self.auto_orbit_frame.grid()
         else:
-            self.auto_orbit_frame.pack_forget()
-            self.manual_vel_frame.pack(fill=tk.X, pady=5)
+            self.auto_orbit_frame.grid_remove()
+            self.manual_vel_frame.grid()
             self.auto_orbit_target = None
+            self._orbit_ctx = None
             self.orbit_target_label.config(text="No target selected", foreground="gray")
     
     def start_orbit_selection(self):
         """Start selecting an orbit target."""
         self.is_selecting_orbit_target = True
         self.orbit_target_label.config(text="Click a body on canvas...", foreground="orange")
-        messagebox.showinfo("Select Target", 
-                          "Click on another body in the canvas to set it as the orbit target.\n\n" +
-                          "The selected body will orbit around the clicked body.")
+        self._status("Click another body on the canvas to set it as the orbit target.",
+                     color="orange", ms=5000)
+    
+    def cancel_orbit_selection(self):
+        """Stop selecting an orbit target without choosing one."""
+        self.is_selecting_orbit_target = False
+        self.orbit_target_label.config(text="No target selected", foreground="gray")
+        self._status("Orbit target selection cancelled.", color="gray")
     
     def set_orbit_target(self, target: CelestialBody):
         """Set the orbit target body."""
-        if target == self.current_body:
+        if target is self.current_body:
             messagebox.showwarning("Invalid Target", "Cannot orbit itself!")
             self.is_selecting_orbit_target = False
             self.orbit_target_label.config(text="No target selected", foreground="gray")
             return
         
         self.auto_orbit_target = target
+        self._orbit_ctx = self._make_orbit_ctx() if self.current_body is not None else None
         self.is_selecting_orbit_target = False
         self.orbit_target_label.config(text=f"Target: {target.name}", foreground="blue")
     
+    def _make_orbit_ctx(self) -> _OrbitCtx:
+        """Build the orbit context for the current body and orbit target."""
+        target = self.auto_orbit_target
+        orbiter = self.current_body
+        return _OrbitCtx(orbiter, target, G * (target.get_mass() + orbiter.get_mass()))
+    
     def apply_auto_orbit(self):
         """Apply automatic orbital velocity."""
-        if self.current_body is None or self.auto_orbit_target is None:
+        body = self.current_body
+        target = self.auto_orbit_target
+        if body is None or target is None:
             messagebox.showwarning("No Target", "Please select an orbit target first.")
             return
         
         try:
-            # Calculate orbital velocity
-            central_pos = self.auto_orbit_target.get_position()
-            orbiting_pos = self.current_body.get_position()
-            central_mass = self.auto_orbit_target.get_mass()
-            orbiting_mass = self.current_body.get_mass()
+            # Calculate orbital velocity; mu only depends on the two masses
+            ctx = self._orbit_ctx
+            if ctx is None or ctx.orbiter is not body or ctx.target is not target:
+                ctx = self._orbit_ctx = self._make_orbit_ctx()
+            central_pos = ctx.target.get_position()
+            orbiting_pos = ctx.orbiter.get_position()
             clockwise = self.orbit_clockwise_var.get()
             
-            vx, vy = calculate_orbital_velocity_vector(
-                central_pos, orbiting_pos, 
-                central_mass, orbiting_mass, 
-                G, clockwise
-            )
-            
-            self.current_body.set_velocity(vx, vy)
-            self.update_display()
+            # Circular orbit, v = sqrt(G(M + m) / r), perpendicular to the radius
+            dx = orbiting_pos[0] - central_pos[0]
+            dy = orbiting_pos[1] - central_pos[1]
+            r = math.hypot(dx, dy)
+            if r == 0.0:
+                v = vx = vy = 0.0
+            else:
+                v = math.sqrt(ctx.mu / r)
+                s = -1.0 if clockwise else 1.0
+                inv_r = 1.0 / r
+                vx = -s * v * dy * inv_r
+                vy = s * v * dx * inv_r
             
-            if self.on_body_updated:
-                self.on_body_updated()
+            with self._batched():
+                body.set_velocity(vx, vy)
+                self.update_display()
+                self._schedule_update()
             
-            messagebox.showinfo("Success", 
-                              f"Orbital velocity applied: {(vx**2 + vy**2)**0.5:.2f} m/s")
+            self._status(f"Orbital velocity applied: {v:.2f} m/s")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to calculate orbit: {e}")
@@ -318,64 +551,72 @@ class BodyEditorPanel:
         if self.current_body.is_setting_velocity:
             self.current_body.velocity_arrow_start = self.current_body.get_position()
             self.create_velocity_button.config(text="✓ Editing Arrow (drag on canvas)")
-            messagebox.showinfo("Velocity Arrow Mode", 
-                              "Now click and drag on the canvas to set velocity direction.\n" +
-                              "The arrow will show the direction.\n" +
-                              "Enter speed in the text box and click 'Apply Speed'.")
+            self._status("Drag on the canvas to set the velocity direction, "
+                         "then enter a speed and click 'Apply Speed'.",
+                         color="blue", ms=5000)
         else:
             self.create_velocity_button.config(text="Create/Edit Velocity Arrow")
         
-        if self.on_body_updated:
-            self.on_body_updated()
+        self._schedule_update()
     
     def apply_velocity_magnitude(self):
         """Apply the velocity magnitude from the text input."""
-        if self.current_body is None:
+        body = self.current_body
+        if body is None:
             return
         
         try:
-            magnitude = float(self.velocity_magnitude_var.get())
+            magnitude = float(self.velocity_entry.get())
             if magnitude < 0:
                 raise ValueError("Speed must be non-negative")
             
             # Get current velocity to extract direction
-            vx, vy = self.current_body.get_velocity()
-            current_mag = (vx**2 + vy**2)**0.5
+            vx, vy = body.get_velocity()
+            h = math.hypot(vx, vy)
             
-            if current_mag == 0:
+            if h == 0.0:
                 # No direction set, warn user
                 messagebox.showwarning("No Direction", 
                                      "Please create a velocity arrow first to set the direction.")
                 return
             
-            # Scale to new magnitude
-            scale = magnitude / current_mag
-            new_vx = vx * scale
-            new_vy = vy * scale
+            # Unit direction times the new magnitude
+            inv = 1.0 / h
+            new_vx = vx * inv * magnitude
+            new_vy = vy * inv * magnitude
             
-            self.current_body.set_velocity(new_vx, new_vy)
+            body.set_velocity(new_vx, new_vy)
+            self._cached_mag = magnitude
             self.update_display()
             
-            if self.on_body_updated:
-                self.on_body_updated()
+            self._schedule_update()
             
         except ValueError as e:
             messagebox.showerror("Invalid Input", f"Error: {e}")
     
-    def start_velocity_setting(self):
-        """Start manual velocity setting with mouse (deprecated - use toggle_velocity_arrow)."""
-        self.toggle_velocity_arrow()
-    
     def delete_body(self):
         """Delete the current body."""
         if self.current_body is None:
             return
         
-        result = messagebox.askyesno("Delete Body", 
-                                    f"Delete {self.current_body.name}?")
-        if result:
-            self.state.remove_body(self.current_body)
-            self.set_body(None)
-            
-            if self.on_body_updated:
-                self.on_body_updated()
+        # First click arms the button; a second click within the window deletes
+        if not self._delete_armed:
+            self._delete_armed = True
+            self.delete_button.config(text="Click again to confirm")
+            self._status(f"Click again to delete {self.current_body.name}", color="red", ms=2000)
+            self._delete_job = self.frame.after(2000, self._disarm_delete)
+            return
+        
+        self._disarm_delete()
+        self.state.remove_body(self.current_body)
+        self.set_body(None)
+        
+        self._schedule_update()
+    
+    def _disarm_delete(self):
+        """Return the delete button to its unarmed state."""
+        if self._delete_job is not None:
+            self.frame.after_cancel(self._delete_job)
+            self._delete_job = None
+        self._delete_armed = False
+        self.delete_button.config(text="Delete Body")
@@ -1,16 +1,46 @@
 """Simulation canvas for rendering and interaction."""
 
+import math
+import time
 import tkinter as tk
-from tkinter import messagebox
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.patches import FancyArrow
-import math
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+from matplotlib.text import Annotation, Text
+import numpy as np
 from typing import Optional, Tuple, Callable
 
 from models import CelestialBody, SimulationState
-from models.simulation_state import SimulationMode
-from utils import AU
+from models.simulation_state import (SimulationMode, POSITIONS_DIRTY, SELECTION_DIRTY,
+                                     VIEW_DIRTY)
+from utils import AU, center_of_mass, nearest_body
+
+
+# Drag events are coalesced and handled at most once per this many ms, ~60 Hz
+MOVE_INTERVAL_MS = 16
+
+# Minimum time between automatic center-of-gravity recenters (seconds)
+COG_INTERVAL = 0.1
+
+# Camera moves smaller than this fraction of the view half-width are skipped
+VIEW_EPSILON = 1e-3
+
+# Velocity arrows are drawn at 1 AU per 30 km/s
+VEL_SCALE_MS_PER_M = 30000.0 / AU
+VEL_SCALE_M_PER_MS = AU / 30000.0
+
+# Scene geometry in meters
+LABEL_OFFSET_Y = 0.2 * AU
+ARROW_MIN_LEN = 0.01 * AU
+SELECTION_RADIUS = 0.15 * AU
+
+# Extra click tolerance around a body marker, in meters
+PICK_TOLERANCE = 0.1 * AU
+
+# Colors cycled through for bodies added by clicking
+_BODY_COLORS = ('#FDB813', '#FF6B35', '#FF0000', '#4A90E2', '#00FF00', '#FF00FF', '#FFFF00')
 
 
 class SimulationCanvas:
@@ -30,6 +60,10 @@ class SimulationCanvas:
         # Callbacks for mode changes
         self.on_body_selected: Optional[Callable[[CelestialBody], None]] = None
         
+        # Other panels, wired up by the app
+        self.body_editor_ref = None
+        self.control_panel_ref = None
+        
         # Canvas state
         self.zoom_level = 3.0  # AU multiplier for view
         self.center_x = 0.0
@@ -40,10 +74,14 @@ class SimulationCanvas:
         self.capture_all_bodies = False
         self.focus_body_mode = False
         self.focused_body: Optional[CelestialBody] = None
-        self.frame_counter = 0
+        self._last_cog_ts = 0.0  # wall-clock time of the last CoG recenter
+        self._cam_key = None  # (state.positions_version, mode) of the last camera fit
         
         # Interaction state
-        self.velocity_arrow: Optional[FancyArrow] = None
+        self.velocity_arrow: Optional[Annotation] = None  # created in setup_plot
+        self._vel_text: Optional[Text] = None  # speed label shown while dragging the arrow
+        self._pending_move: Optional[Tuple[float, float]] = None  # latest drag position
+        self._move_scheduled = False
         self.velocity_start_pos: Optional[Tuple[float, float]] = None
         
         # Panning state (for simulation mode)
@@ -53,12 +91,31 @@ class SimulationCanvas:
         self.pan_center_x_start = 0.0
         self.pan_center_y_start = 0.0
         
-        # Create matplotlib figure
-        self.fig, self.ax = plt.subplots(figsize=(10, 10))
+        # Blitting: the static background (axes, grid, ticks) is captured after
+        # each full draw and restored under the animated artists every frame
+        self._background = None
+        self._static_dirty = True
+        self._drag_bg = None  # full frame minus the velocity arrow, while dragging it
+        
+        # Index of the body hit by the current button press, set by _on_pick
+        self._picked_index = -1
+        
+        # Create matplotlib figure. It is built directly rather than through
+        # pyplot, so no default-backend canvas or figure manager is created
+        # and kept alive behind the TkAgg canvas that actually draws it
+        self.fig = Figure(figsize=(10, 10))
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
         
+        # Plot elements storage
+        self._label_texts = []  # pool of label Texts; the first _n_labels are in use
+        self._n_labels = 0
+        self._sizes_cache = np.empty(0)  # marker sizes from state.masses
+        self._rgba_cache = np.empty((0, 4))  # face colors from state.colors
+        self._sizes_version = -1  # state.masses_version the caches were built for
+        
         # Setup plot
         self.setup_plot()
         
@@ -66,10 +123,8 @@ class SimulationCanvas:
         self.canvas.mpl_connect('button_press_event', self.on_mouse_click)
         self.canvas.mpl_connect('button_release_event', self.on_mouse_release)
         self.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
-        
-        # Plot elements storage
-        self.body_artists = {}
-        self.trail_artists = {}
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('pick_event', self._on_pick)
         
         # Dragging state
         self.is_dragging_arrow = False
@@ -82,6 +137,28 @@ class SimulationCanvas:
         self.fig.patch.set_facecolor('#1a1a1a')
         self.update_view_limits()
         
+        # Persistent animated artists, updated in place by render()
+        self._trails_lc = LineCollection([], linewidths=1, alpha=0.3, animated=True)
+        self.ax.add_collection(self._trails_lc, autolim=False)
+        self._bodies_scatter = self.ax.scatter([], [], s=[], edgecolors='white',
+                                               linewidths=1, zorder=5, animated=True,
+                                               picker=True)
+        self._selection_ring = Circle((0, 0), SELECTION_RADIUS, color='white', fill=False,
+                                      linewidth=2, linestyle='--', visible=False,
+                                      animated=True)
+        self.ax.add_patch(self._selection_ring)
+        
+        # Velocity arrow (god mode) and the speed label shown while dragging it;
+        # both are hidden until needed and then only moved
+        self.velocity_arrow = self.ax.annotate(
+            "", xy=(0, 0), xytext=(0, 0), annotation_clip=False,
+            arrowprops=dict(arrowstyle='-|>', color='yellow', lw=3, mutation_scale=20),
+            zorder=10, animated=True, visible=False)
+        self._vel_text = self.ax.text(0, 0, "", color='yellow', fontsize=10, fontweight='bold',
+                                      ha='center', va='bottom', zorder=11, animated=True,
+                                      visible=False,
+                                      bbox=dict(boxstyle='round', facecolor='black', alpha=0.7))
+        
     def update_view_limits(self):
         """Update the view limits based on zoom and center."""
         limit = self.zoom_level * AU
@@ -90,16 +167,40 @@ class SimulationCanvas:
         self.ax.set_xlabel('X Position (m)', color='white')
         self.ax.set_ylabel('Y Position (m)', color='white')
         self.ax.tick_params(colors='white')
+        self._static_dirty = True
+        self.state.dirty |= VIEW_DIRTY
         
+    def _on_pick(self, event):
+        """
+        Remember which body a button press landed on.
+        
+        Matplotlib hit-tests the scatter and fires pick_event from its own
+        button_press_event handler, which the figure registers before ours,
+        so on_mouse_click sees the result of the same press.
+        """
+        if event.artist is not self._bodies_scatter or not len(event.ind):
+            return
+        ind = event.ind
+        index = ind[0]
+        mouse = event.mouseevent
+        if len(ind) > 1 and mouse.xdata is not None:
+            # Overlapping markers: take the one closest to the cursor
+            offsets = np.asarray(self._bodies_scatter.get_offsets())[ind]
+            index = ind[nearest_body(offsets, mouse.xdata, mouse.ydata, np.inf)]
+        self._picked_index = int(index)
+    
     def on_mouse_click(self, event):
         """Handle mouse click events."""
+        picked, self._picked_index = self._picked_index, -1
+        
         if event.inaxes != self.ax or event.xdata is None or event.ydata is None:
             return
         
         click_x, click_y = event.xdata, event.ydata
         
         if self.state.mode == SimulationMode.GOD_MODE:
-            self.handle_god_mode_click(click_x, click_y, event.button)
+            clicked_body = self.state.bodies[picked] if 0 <= picked < len(self.state.bodies) else None
+            self.handle_god_mode_click(click_x, click_y, event.button, clicked_body)
         elif self.state.mode == SimulationMode.SIMULATION_MODE:
             # Start panning in simulation mode
             if event.button == 1:  # Left click
@@ -120,6 +221,9 @@ class SimulationCanvas:
             return
         
         if self.state.mode == SimulationMode.GOD_MODE:
+            # A move still waiting to be drawn would put the arrow back
+            self._pending_move = None
+            
             # Check if we were dragging a velocity arrow
             selected = self.state.get_selected_body()
             if selected and selected.is_setting_velocity and self.is_dragging_arrow:
@@ -128,11 +232,11 @@ class SimulationCanvas:
                 start_x, start_y = selected.get_position()
                 
                 # Calculate velocity vector (scale: 1 AU = 30 km/s)
-                scale = 30000.0 / AU
-                vx = (end_x - start_x) * scale
-                vy = (end_y - start_y) * scale
+                vx = (end_x - start_x) * VEL_SCALE_MS_PER_M
+                vy = (end_y - start_y) * VEL_SCALE_MS_PER_M
                 
                 selected.set_velocity(vx, vy)
+                self.state.dirty |= POSITIONS_DIRTY
                 
                 # Update the editor display
                 if self.on_body_selected:
@@ -141,13 +245,19 @@ class SimulationCanvas:
                 self.is_dragging_arrow = False
                 self.render()
     
-    def handle_god_mode_click(self, x: float, y: float, button: int):
-        """Handle clicks in God Mode."""
-        # Check if clicking on existing body
-        clicked_body = self.find_body_at_position(x, y)
+    def handle_god_mode_click(self, x: float, y: float, button: int,
+                              clicked_body: Optional[CelestialBody] = None):
+        """
+        Handle clicks in God Mode.
         
+        Args:
+            x: Click x position in meters
+            y: Click y position in meters
+            button: Mouse button number
+            clicked_body: Body under the cursor, as found by the pick handler
+        """
         # Check if we're in orbit target selection mode
-        if hasattr(self, 'body_editor_ref') and self.body_editor_ref and self.body_editor_ref.is_selecting_orbit_target:
+        if self.body_editor_ref is not None and self.body_editor_ref.is_selecting_orbit_target:
             if clicked_body:
                 # Set this body as the orbit target
                 self.body_editor_ref.set_orbit_target(clicked_body)
@@ -155,8 +265,7 @@ class SimulationCanvas:
                 return
             else:
                 # Clicked empty space, cancel selection
-                from tkinter import messagebox
-                messagebox.showinfo("Selection Cancelled", "Click on a body to set as orbit target.")
+                self.body_editor_ref.cancel_orbit_selection()
                 return
         
         # Check if we're in velocity setting mode
@@ -168,8 +277,7 @@ class SimulationCanvas:
         
         if clicked_body:
             # Select the body
-            self.state.deselect_all()
-            clicked_body.is_selected = True
+            self.state.select_body(clicked_body)
             if self.on_body_selected:
                 self.on_body_selected(clicked_body)
         else:
@@ -179,25 +287,13 @@ class SimulationCanvas:
         
         self.render()
     
-    def find_body_at_position(self, x: float, y: float, tolerance: float = 0.1) -> Optional[CelestialBody]:
-        """Find a body near the given position."""
-        tolerance_meters = tolerance * AU
-        
-        for body in self.state.bodies:
-            bx, by = body.get_position()
-            distance = math.sqrt((bx - x)**2 + (by - y)**2)
-            if distance < tolerance_meters:
-                return body
-        return None
-    
     def add_new_body_at_position(self, x: float, y: float):
         """Add a new body at the given position."""
         from utils import EARTH_MASS
         
         # Create a new body with default properties
-        body_num = len(self.state.bodies) + 1
-        colors = ['#FDB813', '#FF6B35', '#FF0000', '#4A90E2', '#00FF00', '#FF00FF', '#FFFF00']
-        color = colors[body_num % len(colors)]
+        body_num = self.state.next_body_num()
+        color = _BODY_COLORS[body_num % len(_BODY_COLORS)]
         
         new_body = CelestialBody(
             name=f"Body {body_num}",
@@ -210,8 +306,7 @@ class SimulationCanvas:
         )
         
         self.state.add_body(new_body)
-        self.state.deselect_all()
-        new_body.is_selected = True
+        self.state.select_body(new_body)
         
         if self.on_body_selected:
             self.on_body_selected(new_body)
@@ -242,7 +337,7 @@ class SimulationCanvas:
                 self.focus_body_mode = False
                 self.focused_body = None
                 # Update control panel buttons if they exist
-                if hasattr(self, 'control_panel_ref'):
+                if self.control_panel_ref is not None:
                     self.control_panel_ref.update_camera_buttons()
             
             self.update_view_limits()
@@ -253,153 +348,267 @@ class SimulationCanvas:
             # Check if any body is in velocity-setting mode
             selected = self.state.get_selected_body()
             if selected and selected.is_setting_velocity:
-                # Update velocity arrow as we drag
-                start_x, start_y = selected.get_position()
-                end_x, end_y = event.xdata, event.ydata
-                
-                # Remove old arrow if exists
-                if self.velocity_arrow:
-                    self.velocity_arrow.remove()
-                    self.velocity_arrow = None
-                
-                # Remove old velocity text if exists
-                for txt in self.ax.texts[:]:
-                    if hasattr(txt, 'is_velocity_text'):
-                        txt.remove()
-                
-                # Draw new arrow
-                dx = end_x - start_x
-                dy = end_y - start_y
-                
-                # Only draw if we have some distance
-                distance = (dx**2 + dy**2)**0.5
-                if distance > 0.01 * AU:
-                    self.velocity_arrow = self.ax.arrow(
-                        start_x, start_y, dx, dy,
-                        head_width=0.1*AU, head_length=0.15*AU,
-                        fc='yellow', ec='yellow', linewidth=3, alpha=0.8, zorder=10
-                    )
-                    
-                    # Show velocity magnitude as text near arrow tip
-                    # Scale: 1 AU = 30 km/s
-                    scale = 30000.0 / AU
-                    velocity = distance * scale
-                    
-                    # Position text at midpoint of arrow
-                    text_x = start_x + dx * 0.6
-                    text_y = start_y + dy * 0.6
-                    
-                    vel_text = self.ax.text(text_x, text_y, f"{velocity:.0f} m/s",
-                                          color='yellow', fontsize=10, fontweight='bold',
-                                          ha='center', va='bottom', zorder=11,
-                                          bbox=dict(boxstyle='round', facecolor='black', alpha=0.7))
-                    vel_text.is_velocity_text = True
-                    
-                    self.canvas.draw_idle()
+                # Motion events can arrive far faster than the screen refreshes;
+                # keep only the latest position and handle it on the next tick
+                self._pending_move = (event.xdata, event.ydata)
+                if not self._move_scheduled:
+                    self._move_scheduled = True
+                    self.canvas_widget.after(MOVE_INTERVAL_MS, self._flush_move)
+    
+    def _flush_move(self):
+        """Update the velocity arrow for the latest coalesced mouse move."""
+        self._move_scheduled = False
+        pending, self._pending_move = self._pending_move, None
+        if pending is None or self.state.mode != SimulationMode.GOD_MODE:
+            return
+        
+        # The body may have left velocity-setting mode since the move
+        selected = self.state.get_selected_body()
+        if selected and selected.is_setting_velocity:
+            # Update velocity arrow as we drag
+            start_x, start_y = selected.get_position()
+            end_x, end_y = pending
+            self._update_velocity_arrow(start_x, start_y, end_x - start_x, end_y - start_y,
+                                        active=True, show_speed=True)
+            self._blit_velocity_arrow()
+    
+    def _update_velocity_arrow(self, x: float, y: float, dx: float, dy: float,
+                               active: bool, show_speed: bool = False):
+        """
+        Point the persistent velocity arrow from (x, y) along (dx, dy).
+        
+        Arrows shorter than ARROW_MIN_LEN are hidden instead.
+        
+        Args:
+            x: Arrow start x in meters
+            y: Arrow start y in meters
+            dx: Arrow x extent in meters
+            dy: Arrow y extent in meters
+            active: Whether the body is having its velocity set (highlighted style)
+            show_speed: Also show the speed the arrow stands for near its tip
+        """
+        length = math.hypot(dx, dy)
+        if length <= ARROW_MIN_LEN:
+            self.clear_velocity_arrow()
+            return
+        
+        if active:
+            color, linewidth, alpha = 'yellow', 3, 0.8
+        else:
+            color, linewidth, alpha = 'cyan', 2, 0.6
+        
+        arrow = self.velocity_arrow
+        arrow.xy = (x + dx, y + dy)
+        arrow.set_position((x, y))
+        patch = arrow.arrow_patch
+        patch.set_color(color)
+        patch.set_linewidth(linewidth)
+        patch.set_alpha(alpha)
+        arrow.set_visible(True)
+        
+        if show_speed:
+            # Label the speed a little past the arrow's midpoint
+            self._vel_text.set_position((x + dx * 0.6, y + dy * 0.6))
+            self._vel_text.set_text(f"{length * VEL_SCALE_MS_PER_M:.0f} m/s")
+            self._vel_text.set_visible(True)
+    
+    def clear_velocity_arrow(self):
+        """Hide the velocity arrow and its speed label."""
+        self.velocity_arrow.set_visible(False)
+        self._vel_text.set_visible(False)
+    
+    def _animated_artists(self) -> list:
+        """Return the per-frame artists in drawing order."""
+        artists = [self._trails_lc]
+        if self._selection_ring.get_visible():
+            artists.append(self._selection_ring)
+        artists.append(self._bodies_scatter)
+        artists.extend(self._label_texts[:self._n_labels])
+        if self.velocity_arrow.get_visible():
+            artists.append(self.velocity_arrow)
+        if self._vel_text.get_visible():
+            artists.append(self._vel_text)
+        return artists
+    
+    def _draw_animated(self):
+        """Draw the animated artists onto the current canvas buffer."""
+        draw_artist = self.ax.draw_artist
+        for artist in self._animated_artists():
+            draw_artist(artist)
+    
+    def _on_draw(self, event):
+        """Capture the static background after a full draw, then overlay the frame."""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._drag_bg = None
+        # The pick radius is in pixels; rescale it for the new view and size
+        px_per_m = self.ax.transData.get_matrix()[0, 0]
+        self._bodies_scatter.set_pickradius(PICK_TOLERANCE * px_per_m)
+        # Trail points closer together than a pixel are not worth storing
+        self.state.trail_min_spacing = 1.0 / px_per_m
+        self._draw_animated()
+    
+    def _blit(self):
+        """Present the current artists, redrawing the background only when needed."""
+        if self._static_dirty or self._background is None:
+            # Full redraw at the next idle point (coalesced by matplotlib);
+            # _on_draw then recaptures the background and draws the artists.
+            # Until it runs there is no valid background to blit onto.
+            self._static_dirty = False
+            self._background = None
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_animated()
+            self.canvas.blit(self.fig.bbox)
+    
+    def _blit_velocity_arrow(self):
+        """
+        Redraw only the velocity arrow and its label.
+        
+        The rest of the frame is captured once into _drag_bg and restored
+        under the arrow on every move, so the cost doesn't depend on the
+        number of bodies. Falls back to a normal frame when there is no
+        valid background yet.
+        """
+        if self._drag_bg is None:
+            if self._static_dirty or self._background is None:
+                self._blit()
+                return
+            self.canvas.restore_region(self._background)
+            draw_artist = self.ax.draw_artist
+            for artist in self._animated_artists():
+                if artist is not self.velocity_arrow and artist is not self._vel_text:
+                    draw_artist(artist)
+            self._drag_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        
+        self.canvas.restore_region(self._drag_bg)
+        self.ax.draw_artist(self.velocity_arrow)
+        self.ax.draw_artist(self._vel_text)
+        self.canvas.blit(self.fig.bbox)
     
     def render(self):
-        """Render all bodies and trails."""
-        # Clear previous artists
-        for artist in list(self.body_artists.values()):
-            artist.remove()
-        for artist in list(self.trail_artists.values()):
-            artist.remove()
-        self.body_artists.clear()
-        self.trail_artists.clear()
+        """
+        Render all bodies and trails.
         
-        # Clear velocity arrow if exists
-        if self.velocity_arrow:
-            self.velocity_arrow.remove()
-            self.velocity_arrow = None
+        Only the parts named by state.dirty are refreshed; when nothing is
+        dirty the call returns without touching the canvas. A view-only
+        change skips the artist updates and just redraws.
+        """
+        dirty = self.state.dirty
+        if not dirty:
+            return
         
-        # Clear ALL text objects (labels and velocity text)
-        for txt in self.ax.texts[:]:
-            txt.remove()
+        self._sync_artists(dirty)
+        self._blit()
+        self.state.dirty = 0
+    
+    def _sync_artists(self, dirty: int):
+        """
+        Update the camera and artist data for the given dirty bits.
         
-        # Clear all patches (selection circles, etc.)
-        for patch in self.ax.patches[:]:
-            patch.remove()
+        Only mutates artists; nothing is drawn until _blit() runs.
         
-        # Update camera if in simulation mode
-        if self.state.mode == SimulationMode.SIMULATION_MODE:
-            self.frame_counter += 1
-            
+        Args:
+            dirty: Bitmask of *_DIRTY flags to refresh
+        """
+        # The scene is about to change; any arrow-drag background is stale
+        self._drag_bg = None
+        
+        is_sim = self.state.mode == SimulationMode.SIMULATION_MODE
+        
+        # Update camera if in simulation mode (it only follows the bodies)
+        if is_sim and dirty & POSITIONS_DIRTY:
             # Focus on specific body mode (highest priority)
-            if self.focus_body_mode and self.focused_body and self.focused_body in self.state.bodies:
+            if self.focus_body_mode and self.focused_body and self.state.has_body(self.focused_body):
                 x, y = self.focused_body.get_position()
                 self.center_x = x
                 self.center_y = y
                 self.update_view_limits()
-            # Auto zoom to center of gravity every 10 frames
-            elif self.auto_zoom_to_cog and self.frame_counter % 10 == 0:
+            # Auto zoom to center of gravity, at most every COG_INTERVAL seconds
+            elif self.auto_zoom_to_cog and time.perf_counter() - self._last_cog_ts > COG_INTERVAL:
+                self._last_cog_ts = time.perf_counter()
                 self.center_to_cog()
             # Capture all bodies mode
             elif self.capture_all_bodies:
                 self.zoom_to_capture_all()
         
-        # Draw trails in simulation mode
-        if self.state.mode == SimulationMode.SIMULATION_MODE:
-            for i, trajectory in enumerate(self.state.trajectories):
-                if len(trajectory) > 1:
-                    x_vals, y_vals = zip(*trajectory)
-                    trail, = self.ax.plot(x_vals, y_vals, '-', 
-                                         color=self.state.bodies[i].color, 
-                                         alpha=0.3, linewidth=1)
-                    self.trail_artists[i] = trail
-        
-        # Draw bodies
-        for body in self.state.bodies:
-            x, y = body.get_position()
-            
-            # Size based on mass (logarithmic scale)
-            mass_scale = math.log10(body.get_mass() / 1e24) if body.get_mass() > 0 else 1
-            size = max(100, mass_scale * 50)
-            
-            # Only highlight if selected AND in God Mode
-            if body.is_selected and self.state.mode == SimulationMode.GOD_MODE:
-                size *= 1.5
-                # Draw selection ring
-                circle = plt.Circle((x, y), 0.15 * AU, color='white', 
-                                  fill=False, linewidth=2, linestyle='--')
-                self.ax.add_patch(circle)
-            
-            # Draw body
-            scatter = self.ax.scatter([x], [y], s=size, c=[body.color], 
-                                     edgecolors='white', linewidths=1, zorder=5)
-            self.body_artists[body] = scatter
-            
-            # Draw label
-            text = self.ax.text(x, y + 0.2*AU, body.name, 
-                              color='white', fontsize=9, 
-                              ha='center', va='bottom', zorder=6)
+        # Update trails (simulation mode only), all in one LineCollection fed
+        # straight from the ring buffer view, one segment per body
+        if dirty & POSITIONS_DIRTY:
+            trails = self.state.trails
+            if is_sim and len(trails) > 1:
+                self._trails_lc.set_segments(trails.view())
+            else:
+                self._trails_lc.set_segments([])
         
-        # Draw velocity arrow ONLY in God Mode for selected body
-        if self.state.mode == SimulationMode.GOD_MODE:
-            selected = self.state.get_selected_body()
-            if selected:
-                vx, vy = selected.get_velocity()
-                x, y = selected.get_position()
-                
-                # Show arrow if in velocity setting mode OR if velocity is non-zero
-                if selected.is_setting_velocity or (vx != 0 or vy != 0):
-                    # Scale velocity for visualization (1 AU per 30 km/s)
-                    scale = AU / 30000.0
-                    arrow_dx = vx * scale
-                    arrow_dy = vy * scale
-                    
-                    # Only draw if arrow has some length
-                    arrow_length = (arrow_dx**2 + arrow_dy**2)**0.5
-                    if arrow_length > 0.01 * AU:
-                        color = 'yellow' if selected.is_setting_velocity else 'cyan'
-                        alpha = 0.8 if selected.is_setting_velocity else 0.6
-                        linewidth = 3 if selected.is_setting_velocity else 2
-                        
-                        self.velocity_arrow = self.ax.arrow(x, y, arrow_dx, arrow_dy,
-                                            head_width=0.1*AU, head_length=0.15*AU,
-                                            fc=color, ec=color, linewidth=linewidth, 
-                                            alpha=alpha, zorder=7)
-        
-        self.canvas.draw()
+        if dirty & (POSITIONS_DIRTY | SELECTION_DIRTY):
+            self._update_bodies(is_sim)
+    
+    def _update_bodies(self, is_sim: bool):
+        """Update the body markers, labels, selection ring and velocity arrow."""
+        # Clear velocity arrow if exists
+        self.clear_velocity_arrow()
+        
+        # Update bodies straight from the float64 positions, so markers, the
+        # selection ring, trails and the arrow all use the same coordinates
+        bodies = self.state.bodies
+        positions = self.state.positions
+        
+        # Size based on mass (logarithmic scale), recomputed only when masses
+        # change; fmax maps the log of a non-positive mass (nan/-inf) to the
+        # minimum size. Colors only change when bodies are added or removed,
+        # which also bumps masses_version, so they are converted alongside and
+        # shared by the markers and the trails
+        if self._sizes_version != self.state.masses_version:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self._sizes_cache = np.fmax(100.0, np.log10(self.state.masses / 1e24) * 50)
+            self._rgba_cache = to_rgba_array(self.state.colors)
+            self._trails_lc.set_color(self._rgba_cache)
+            self._sizes_version = self.state.masses_version
+        sizes = self._sizes_cache
+        
+        # Only highlight if selected AND in God Mode
+        self._selection_ring.set_visible(False)
+        selected = self.state.selected_index() if not is_sim else None
+        if selected is not None:
+            sizes = sizes.copy()
+            sizes[selected] *= 1.5
+            # Move selection ring
+            self._selection_ring.center = tuple(positions[selected])
+            self._selection_ring.set_visible(True)
+        
+        self._bodies_scatter.set_offsets(positions)
+        self._bodies_scatter.set_sizes(sizes)
+        self._bodies_scatter.set_facecolors(self._rgba_cache)
+        
+        # Labels: reuse pooled Text artists, creating only when the pool is too
+        # small and hiding (not removing) the ones no longer needed
+        labels = self._label_texts
+        while len(labels) < len(bodies):
+            labels.append(self.ax.text(0, 0, "", color='white', fontsize=9,
+                                       ha='center', va='bottom', zorder=6, animated=True))
+        label_xy = (positions + (0.0, LABEL_OFFSET_Y)).tolist()
+        for label, body, xy in zip(labels, bodies, label_xy):
+            label.set_position(xy)
+            label.set_text(body.name)
+            label.set_visible(True)
+        for label in labels[len(bodies):self._n_labels]:
+            label.set_visible(False)
+        self._n_labels = len(bodies)
+        
+        # Draw velocity arrow ONLY in God Mode for selected body, reading its
+        # state from the arrays rather than through the body object
+        if selected is not None:
+            index = selected
+            setting = bodies[index].is_setting_velocity
+            vx, vy = self.state.velocities[index].tolist()
+            x, y = self.state.positions[index].tolist()
+            
+            # Show arrow if in velocity setting mode OR if velocity is non-zero
+            if setting or (vx != 0 or vy != 0):
+                # Scale velocity for visualization (1 AU per 30 km/s)
+                self._update_velocity_arrow(x, y, vx * VEL_SCALE_M_PER_MS,
+                                            vy * VEL_SCALE_M_PER_MS, active=setting)
     
     def zoom_in(self):
         """Zoom in the view."""
@@ -426,21 +635,21 @@ class SimulationCanvas:
         if not self.state.bodies:
             return
         
-        # Calculate center of gravity
-        total_mass = 0.0
-        cog_x = 0.0
-        cog_y = 0.0
-        
-        for body in self.state.bodies:
-            mass = body.get_mass()
-            x, y = body.get_position()
-            cog_x += mass * x
-            cog_y += mass * y
-            total_mass += mass
-        
-        if total_mass > 0:
-            cog_x /= total_mass
-            cog_y /= total_mass
+        # Nothing to do if the bodies haven't moved since the last recenter
+        key = (self.state.positions_version, 'cog')
+        if key == self._cam_key:
+            return
+        self._cam_key = key
+        
+        # Calculate center of gravity from the state's mass/position arrays
+        cog = center_of_mass(self.state.masses, self.state.positions)
+        
+        if cog is not None:
+            cog_x, cog_y = cog
+            
+            # Skip the relayout when the view would move by less than a pixel or so
+            if math.hypot(cog_x - self.center_x, cog_y - self.center_y) < VIEW_EPSILON * self.zoom_level * AU:
+                return
             
             self.center_x = cog_x
             self.center_y = cog_y
@@ -448,17 +657,19 @@ class SimulationCanvas:
     
     def zoom_to_capture_all(self):
         """Zoom to capture all bodies in view."""
-        if not self.state.bodies:
+        positions = self.state.positions
+        if not len(positions):
             return
         
-        # Find bounding box of all bodies
-        positions = [body.get_position() for body in self.state.bodies]
-        if not positions:
+        # Nothing to do if the bodies haven't moved since the last fit
+        key = (self.state.positions_version, 'all')
+        if key == self._cam_key:
             return
+        self._cam_key = key
         
-        x_coords, y_coords = zip(*positions)
-        min_x, max_x = min(x_coords), max(x_coords)
-        min_y, max_y = min(y_coords), max(y_coords)
+        # Find bounding box of all bodies
+        min_x, min_y = positions.min(axis=0)
+        max_x, max_y = positions.max(axis=0)
         
         # Add padding (20%)
         x_range = max_x - min_x
@@ -471,15 +682,25 @@ class SimulationCanvas:
         max_y += y_range * padding
         
         # Center on midpoint
-        self.center_x = (min_x + max_x) / 2
-        self.center_y = (min_y + max_y) / 2
+        center_x = float(min_x + max_x) / 2
+        center_y = float(min_y + max_y) / 2
         
         # Set zoom to capture all
         x_span = (max_x - min_x) / 2
         y_span = (max_y - min_y) / 2
-        max_span = max(x_span, y_span)
+        max_span = float(max(x_span, y_span))
+        zoom_level = max_span / AU if max_span > 0 else 3.0
+        
+        # Skip the relayout when the bounds moved by a sub-pixel amount
+        tolerance = VIEW_EPSILON * self.zoom_level * AU
+        if (abs(center_x - self.center_x) < tolerance
+                and abs(center_y - self.center_y) < tolerance
+                and abs(zoom_level - self.zoom_level) < VIEW_EPSILON * self.zoom_level):
+            return
         
-        self.zoom_level = max_span / AU if max_span > 0 else 3.0
+        self.center_x = center_x
+        self.center_y = center_y
+        self.zoom_level = zoom_level
         self.update_view_limits()
     
     def toggle_auto_zoom_cog(self):
@@ -24,6 +24,13 @@ class ControlPanel:
         # Callbacks
         self.on_mode_change = None
         self.on_clear_all = None
+        self.on_play_pause = None
+        
+        # Names currently shown in the focus dropdown
+        self._focus_body_names: list = []
+        
+        # Text currently shown by time_label
+        self._time_text = "0.00 hours"
         
         # Create frame
         self.frame = ttk.Frame(parent, padding="10")
@@ -81,7 +88,7 @@ class ControlPanel:
         time_frame = ttk.LabelFrame(self.frame, text="Time", padding="5")
         time_frame.pack(side=tk.LEFT, padx=5)
         
-        self.time_label = ttk.Label(time_frame, text="0.00 hours", 
+        self.time_label = ttk.Label(time_frame, text=self._time_text, 
                                     font=("Arial", 12, "bold"))
         self.time_label.pack()
         
@@ -101,6 +108,21 @@ class ControlPanel:
         
         ttk.Label(warp_frame, text="x").pack(side=tk.LEFT)
         
+        # Trail length control
+        trail_frame = ttk.Frame(time_frame)
+        trail_frame.pack(pady=2)
+        
+        ttk.Label(trail_frame, text="Trail:").pack(side=tk.LEFT, padx=2)
+        
+        self.trail_var = tk.IntVar(value=self.state.trail_length)
+        self.trail_options = [256, 512, 1024, 2048, 4096, 8192]
+        self.trail_combo = ttk.Combobox(trail_frame, textvariable=self.trail_var,
+                                       values=self.trail_options, width=8, state='readonly')
+        self.trail_combo.pack(side=tk.LEFT, padx=2)
+        self.trail_combo.bind('<<ComboboxSelected>>', self.on_trail_length_change)
+        
+        ttk.Label(trail_frame, text="pts").pack(side=tk.LEFT)
+        
         # View controls
         view_frame = ttk.LabelFrame(self.frame, text="View", padding="5")
         view_frame.pack(side=tk.LEFT, padx=5)
@@ -172,6 +194,11 @@ class ControlPanel:
             self.play_pause_button.config(text="⏸ Pause")
         else:
             self.play_pause_button.config(text="▶ Play")
+            # The frame loop throttles the readout; show the exact paused time
+            self.update_time_display()
+        
+        if self.on_play_pause:
+            self.on_play_pause()
     
     def stop_simulation(self):
         """Stop simulation and return to God Mode."""
@@ -183,7 +210,7 @@ class ControlPanel:
         self.play_pause_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.DISABLED)
         self.clear_button.config(state=tk.NORMAL)
-        self.time_label.config(text="0.00 hours")
+        self._set_time_text("0.00 hours")
         
         if self.on_mode_change:
             self.on_mode_change()
@@ -195,13 +222,22 @@ class ControlPanel:
     
     def update_time_display(self):
         """Update the time display."""
-        time_str = self.state.get_time_string()
-        self.time_label.config(text=time_str)
+        self._set_time_text(self.state.get_time_string())
+    
+    def _set_time_text(self, text: str):
+        """Show text in the time label, skipping the Tk call if it is unchanged."""
+        if text != self._time_text:
+            self._time_text = text
+            self.time_label.config(text=text)
     
     def on_warp_change(self, event=None):
         """Handle time warp change."""
         self.state.time_warp = self.warp_var.get()
     
+    def on_trail_length_change(self, event=None):
+        """Handle trail length change."""
+        self.state.set_trail_length(self.trail_var.get())
+    
     def on_zoom_in(self):
         """Callback for zoom in button."""
         pass  # Will be connected by main app
@@ -234,5 +270,7 @@ class ControlPanel:
     def update_focus_body_list(self):
         """Update the list of bodies available for focusing."""
         body_names = ["None"] + [body.name for body in self.state.bodies]
-        self.focus_body_combo['values'] = body_names
-        self.focus_body_combo['values'] = body_names
+        # Only touch the widget when the visible list actually changed
+        if body_names != self._focus_body_names:
+            self.focus_body_combo['values'] = body_names
+            self._focus_body_names = body_names
@@ -1,11 +1,60 @@
-"""Celestial body model wrapper around nbody.Body."""
+"""Celestial body model: metadata plus a view onto one row of body state."""
 
-import nbody
+import functools
+import itertools
+import sys
+
+import numpy as np
 from typing import Optional, Tuple
 
 
+@functools.lru_cache(maxsize=None)
+def tk_color(color: str) -> str:
+    """
+    Return the canonical, interned form of a '#RRGGBB' color string.
+    
+    Bodies sharing a color share one string object, so downstream color
+    lookups hit the interned-string fast path.
+    """
+    return sys.intern(color.upper())
+
+
+# Source of CelestialBody.uid values
+_uid_counter = itertools.count()
+
+
+class BodyRow:
+    """
+    Single-row state store for a body that isn't part of a simulation yet.
+    
+    Has the same masses/positions/velocities layout as SimulationState, so
+    a CelestialBody reads and writes it exactly like the shared arrays.
+    """
+    
+    __slots__ = ('masses', 'positions', 'velocities')
+    
+    def __init__(self, mass: float, x: float, y: float, vx: float, vy: float):
+        self.masses = np.array([mass], dtype=float)
+        self.positions = np.array([[x, y]], dtype=float)
+        self.velocities = np.array([[vx, vy]], dtype=float)
+
+
 class CelestialBody:
-    """Wrapper class for nbody.Body with additional metadata and state."""
+    """
+    A celestial body: display metadata plus a view onto its physical state.
+    
+    Mass, position and velocity live in struct-of-arrays storage, as row
+    `_index` of `_store`. While the body belongs to a SimulationState the
+    store is the state itself; otherwise it is a private BodyRow.
+    """
+    
+    # Fixed attribute layout: no per-instance __dict__, cheaper attribute access
+    __slots__ = (
+        'uid', 'name', 'color',
+        'initial_mass', 'initial_position', 'initial_velocity',
+        '_store', '_index',
+        'is_selected', 'is_setting_velocity', 'velocity_arrow_start',
+    )
     
     def __init__(self, name: str, mass: float, x: float, y: float, vx: float, vy: float, color: str = "#FFFFFF"):
         """
@@ -20,58 +69,66 @@ class CelestialBody:
             vy: Initial velocity in y direction (m/s)
             color: Hex color for visualization
         """
+        self.uid = next(_uid_counter)  # stable identity for lookups
         self.name = name
-        self.color = color
+        self.color = tk_color(color)
         self.initial_mass = mass
         self.initial_position = (x, y)
         self.initial_velocity = (vx, vy)
         
-        # Create the actual nbody.Body
-        self.nbody_body = nbody.Body(mass, x, y, vx, vy)
+        # Physical state, until a SimulationState takes the body over
+        self._store = BodyRow(mass, x, y, vx, vy)
+        self._index = 0
         
         # For God Mode editing
         self.is_selected = False
         self.is_setting_velocity = False
         self.velocity_arrow_start: Optional[Tuple[float, float]] = None
         
+    def attach(self, store, index: int):
+        """Point the body at row `index` of `store` (values are not copied)."""
+        self._store = store
+        self._index = index
+    
+    def detach(self):
+        """Move the body's current state into a private BodyRow."""
+        x, y = self.get_position()
+        vx, vy = self.get_velocity()
+        self._store = BodyRow(self.get_mass(), x, y, vx, vy)
+        self._index = 0
+    
     def get_position(self) -> Tuple[float, float]:
         """Get current position as (x, y) tuple."""
-        return (self.nbody_body.get_x(), self.nbody_body.get_y())
+        x, y = self._store.positions[self._index].tolist()
+        return (x, y)
     
     def get_velocity(self) -> Tuple[float, float]:
         """Get current velocity as (vx, vy) tuple."""
-        return (self.nbody_body.get_v_x(), self.nbody_body.get_v_y())
+        vx, vy = self._store.velocities[self._index].tolist()
+        return (vx, vy)
     
     def set_position(self, x: float, y: float):
         """Set body position."""
-        # Need to recreate the body with new position
-        vx, vy = self.get_velocity()
-        mass = self.nbody_body.get_mass()
-        self.nbody_body = nbody.Body(mass, x, y, vx, vy)
+        self._store.positions[self._index] = (x, y)
         
     def set_velocity(self, vx: float, vy: float):
         """Set body velocity."""
-        # Need to recreate the body with new velocity
-        x, y = self.get_position()
-        mass = self.nbody_body.get_mass()
-        self.nbody_body = nbody.Body(mass, x, y, vx, vy)
+        self._store.velocities[self._index] = (vx, vy)
     
     def set_mass(self, mass: float):
         """Set body mass."""
-        x, y = self.get_position()
-        vx, vy = self.get_velocity()
-        self.nbody_body = nbody.Body(mass, x, y, vx, vy)
+        self._store.masses[self._index] = mass
         self.initial_mass = mass
     
     def get_mass(self) -> float:
         """Get body mass."""
-        return self.nbody_body.get_mass()
+        return float(self._store.masses[self._index])
     
     def reset_to_initial(self):
         """Reset body to initial conditions."""
-        x, y = self.initial_position
-        vx, vy = self.initial_velocity
-        self.nbody_body = nbody.Body(self.initial_mass, x, y, vx, vy)
+        self.set_position(*self.initial_position)
+        self.set_velocity(*self.initial_velocity)
+        self._store.masses[self._index] = self.initial_mass
     
     def distance_to_point(self, px: float, py: float) -> float:
         """Calculate distance from body to a point."""
@@ -1,15 +1,34 @@
 """Simulation state manager."""
 
 import nbody
-from typing import List, Optional
-from enum import Enum
+import numpy as np
+from typing import Dict, List, Optional
+from enum import IntEnum
 from .body import CelestialBody
+from .trail import TrailBuffer
 
 
-class SimulationMode(Enum):
+# Default number of points kept per body trajectory
+DEFAULT_TRAIL_LENGTH = 2048
+
+# Time display units, as seconds and precomputed reciprocals
+SECONDS_PER_DAY = 86400.0
+SECONDS_PER_YEAR = 365.25 * SECONDS_PER_DAY
+_PER_HOUR = 1.0 / 3600.0
+_PER_DAY = 1.0 / SECONDS_PER_DAY
+_PER_YEAR = 1.0 / SECONDS_PER_YEAR
+
+# SimulationState.dirty bits, telling the renderer what changed since the last frame
+POSITIONS_DIRTY = 1  # body positions, velocities, masses or the body list
+SELECTION_DIRTY = 2  # selection or other god-mode overlays
+VIEW_DIRTY = 4       # camera center or zoom
+ALL_DIRTY = POSITIONS_DIRTY | SELECTION_DIRTY | VIEW_DIRTY
+
+
+class SimulationMode(IntEnum):
     """Simulation mode enumeration."""
-    GOD_MODE = "god"
-    SIMULATION_MODE = "simulation"
+    GOD_MODE = 0
+    SIMULATION_MODE = 1
 
 
 class SimulationState:
@@ -18,6 +37,8 @@ class SimulationState:
     def __init__(self):
         """Initialize simulation state."""
         self.bodies: List[CelestialBody] = []
+        self._body_by_id: Dict[int, CelestialBody] = {}  # uid -> body
+        self._next_body_num = 1  # counts every body ever added since the last clear
         self.kosmos: Optional[nbody.Kosmos] = None
         self.mode = SimulationMode.GOD_MODE
         self.is_running = False
@@ -25,48 +46,210 @@ class SimulationState:
         self.time_step = 3600.0  # 1 hour default
         self.time_warp = 1.0  # 1x speed
         
-        # Trajectory storage for visualization
-        self.trajectories: List[List[tuple]] = []
+        # Struct-of-arrays body state (row i <-> bodies[i]). These arrays are
+        # the canonical store: each CelestialBody is a view onto its row, and
+        # Kosmos is built from them and read back into them. Colors and the
+        # selection are owned here too; use select_body/deselect_all
+        self.positions = np.empty((0, 2))
+        self.velocities = np.empty((0, 2))
+        self.masses = np.empty(0)
+        self.colors: List[str] = []
+        # Initial conditions restored by switch_to_god_mode. Positions and
+        # velocities are fixed when a body is added; masses can be edited in
+        # God Mode, so they are snapshotted when the simulation starts
+        self.initial_positions = np.empty((0, 2))
+        self.initial_velocities = np.empty((0, 2))
+        self._start_masses = np.empty(0)
+        self.masses_version = 0  # bumped whenever any mass may have changed
+        self.positions_version = 0  # bumped whenever positions is rebuilt
+        self._selected: Optional[CelestialBody] = None  # at most one body
+        
+        # Trajectory storage for visualization: one fixed-size ring buffer
+        # with a row per body, so trail memory and drawing cost stay constant
+        # over long runs
+        self.trail_length = DEFAULT_TRAIL_LENGTH
+        self.trails = TrailBuffer(self.trail_length)
+        # Minimum distance (m) a body must move before a new trail point is
+        # stored; the canvas sets it to one pixel of the current view
+        self.trail_min_spacing = 0.0
+        
+        # Last time_elapsed and (hundredths, unit) shown by get_time_string,
+        # and its text
+        self._time_seconds = -1.0
+        self._time_bucket = None
+        self._time_string = ""
+        
+        # Bitmask of *_DIRTY flags; cleared by the renderer after drawing
+        self.dirty = ALL_DIRTY
+        
+        # Stepping implementation for the current mode, swapped by the mode
+        # switches so step_simulation_n needs no mode or Kosmos checks
+        self._step_n = self._step_idle
         
     def add_body(self, body: CelestialBody):
         """Add a body to the simulation."""
-        self.bodies.append(body)
-        self.trajectories.append([])
+        self.add_bodies([body])
+        
+    def add_bodies(self, bodies: List[CelestialBody]):
+        """Add several bodies to the simulation at once."""
+        # Copy the bodies' own state in, then point them at their new rows
+        self.masses = np.concatenate((self.masses, [b.get_mass() for b in bodies]))
+        self.positions = np.concatenate(
+            (self.positions, np.reshape([b.get_position() for b in bodies], (-1, 2))))
+        self.velocities = np.concatenate(
+            (self.velocities, np.reshape([b.get_velocity() for b in bodies], (-1, 2))))
+        self.initial_positions = np.concatenate(
+            (self.initial_positions, np.reshape([b.initial_position for b in bodies], (-1, 2))))
+        self.initial_velocities = np.concatenate(
+            (self.initial_velocities, np.reshape([b.initial_velocity for b in bodies], (-1, 2))))
+        for index, body in enumerate(bodies, len(self.bodies)):
+            body.attach(self, index)
+        
+        self.bodies.extend(bodies)
+        self._next_body_num += len(bodies)
+        self.trails.add_rows(len(bodies))
+        self._body_by_id.update((b.uid, b) for b in bodies)
+        self.colors.extend(b.color for b in bodies)
+        if self._selected is None:
+            self._selected = next((b for b in bodies if b.is_selected), None)
+        self.masses_version += 1
+        self.positions_version += 1
+        self.dirty |= POSITIONS_DIRTY
+    
+    def add_bodies_soa(self, arrays: dict):
+        """
+        Add bodies from struct-of-arrays data.
         
+        The arrays are appended to the state's backing arrays directly;
+        CelestialBody views onto the new rows are created for the editor and
+        canvas.
+        
+        Args:
+            arrays: Dict with 'mass' (N,), 'pos' (N, 2) and 'vel' (N, 2)
+                arrays plus parallel 'names' and 'colors' sequences
+        """
+        mass, pos, vel = arrays['mass'], arrays['pos'], arrays['vel']
+        self.masses = np.concatenate((self.masses, mass))
+        self.positions = np.concatenate((self.positions, pos))
+        self.velocities = np.concatenate((self.velocities, vel))
+        self.initial_positions = np.concatenate((self.initial_positions, pos))
+        self.initial_velocities = np.concatenate((self.initial_velocities, vel))
+        
+        new_bodies = [
+            CelestialBody(name, m, x, y, vx, vy, color)
+            for name, color, m, (x, y), (vx, vy) in zip(
+                arrays['names'], arrays['colors'],
+                mass.tolist(), pos.tolist(), vel.tolist())
+        ]
+        for index, body in enumerate(new_bodies, len(self.bodies)):
+            body.attach(self, index)
+        self.bodies.extend(new_bodies)
+        self._next_body_num += len(new_bodies)
+        self.trails.add_rows(len(new_bodies))
+        self._body_by_id.update((b.uid, b) for b in new_bodies)
+        self.colors.extend(b.color for b in new_bodies)
+        self.masses_version += 1
+        self.positions_version += 1
+        self.dirty |= POSITIONS_DIRTY
+    
     def remove_body(self, body: CelestialBody):
         """Remove a body from the simulation."""
-        if body in self.bodies:
-            index = self.bodies.index(body)
-            self.bodies.pop(index)
-            self.trajectories.pop(index)
+        if self._body_by_id.pop(body.uid, None) is None:
+            return
+        
+        if body is self._selected:
+            self._selected = None
+        
+        # The body keeps its current state after leaving the arrays
+        index = body._index
+        body.detach()
+        
+        # Swap-and-pop: move the last body into the freed slot so nothing
+        # else has to be shifted or renumbered (body order is not preserved)
+        last = len(self.bodies) - 1
+        if index != last:
+            moved = self.bodies[last]
+            self.bodies[index] = moved
+            self.colors[index] = self.colors[last]
+            self.masses[index] = self.masses[last]
+            self.positions[index] = self.positions[last]
+            self.velocities[index] = self.velocities[last]
+            self.initial_positions[index] = self.initial_positions[last]
+            self.initial_velocities[index] = self.initial_velocities[last]
+            moved.attach(self, index)
+        self.bodies.pop()
+        self.colors.pop()
+        self.trails.remove_row(index)
+        self.masses = self.masses[:last]
+        self.positions = self.positions[:last]
+        self.velocities = self.velocities[:last]
+        self.initial_positions = self.initial_positions[:last]
+        self.initial_velocities = self.initial_velocities[:last]
+        self.masses_version += 1
+        self.positions_version += 1
+        self.dirty |= POSITIONS_DIRTY
+    
+    def next_body_num(self) -> int:
+        """
+        Get the number the next added body will have.
+        
+        Unlike len(bodies) + 1 this never goes backwards when a body is
+        removed, so default names stay unique.
+        """
+        return self._next_body_num
+    
+    def mark_mass_dirty(self):
+        """Note that a body was edited in place, invalidating mass-derived caches."""
+        self.masses_version += 1
+        self.dirty |= POSITIONS_DIRTY
+    
+    def has_body(self, body: CelestialBody) -> bool:
+        """Check whether a body is part of the simulation."""
+        return self._body_by_id.get(body.uid) is body
     
     def get_selected_body(self) -> Optional[CelestialBody]:
         """Get the currently selected body."""
-        for body in self.bodies:
-            if body.is_selected:
-                return body
-        return None
+        return self._selected
+    
+    def selected_index(self) -> Optional[int]:
+        """Get the array row of the selected body, if any."""
+        return None if self._selected is None else self._selected._index
+    
+    def select_body(self, body: CelestialBody):
+        """Make body the only selected body."""
+        self.deselect_all()
+        body.is_selected = True
+        self._selected = body
+        self.dirty |= SELECTION_DIRTY
     
     def deselect_all(self):
         """Deselect all bodies."""
-        for body in self.bodies:
-            body.is_selected = False
+        if self._selected is not None:
+            self._selected.is_selected = False
+            self._selected = None
+        self.dirty |= SELECTION_DIRTY
     
     def switch_to_simulation_mode(self):
         """Switch from God Mode to Simulation Mode."""
         if self.mode == SimulationMode.SIMULATION_MODE:
             return
         
-        # Create Kosmos simulation with current bodies
-        nbody_bodies = [body.nbody_body for body in self.bodies]
+        # Create Kosmos simulation from the current body arrays
+        nbody_bodies = [
+            nbody.Body(m, x, y, vx, vy)
+            for m, (x, y), (vx, vy) in zip(
+                self.masses.tolist(), self.positions.tolist(), self.velocities.tolist())
+        ]
         self.kosmos = nbody.Kosmos(nbody_bodies)
+        self._start_masses = self.masses.copy()
         
         # Initialize trajectories with current positions
-        for i, body in enumerate(self.bodies):
-            self.trajectories[i] = [body.get_position()]
+        self.trails.reset(self.positions)
         
         self.mode = SimulationMode.SIMULATION_MODE
+        self._step_n = self._step_kosmos
         self.time_elapsed = 0.0
+        self.dirty = ALL_DIRTY
         
     def switch_to_god_mode(self):
         """Switch from Simulation Mode back to God Mode."""
@@ -74,51 +257,137 @@ class SimulationState:
             return
         
         self.mode = SimulationMode.GOD_MODE
+        self._step_n = self._step_idle
         self.is_running = False
         self.kosmos = None
         
-        # Reset bodies to initial conditions
-        for body in self.bodies:
-            body.reset_to_initial()
+        # Reset bodies to initial conditions, one array copy each
+        if self._start_masses.shape == self.masses.shape:
+            np.copyto(self.masses, self._start_masses)
+        else:
+            # Bodies were added or removed mid-run
+            self.masses[:] = [b.initial_mass for b in self.bodies]
+        np.copyto(self.positions, self.initial_positions)
+        np.copyto(self.velocities, self.initial_velocities)
+        self.positions_version += 1
         
         # Clear trajectories
-        self.trajectories = [[] for _ in self.bodies]
+        self.trails.clear()
         self.time_elapsed = 0.0
+        self.dirty = ALL_DIRTY
     
     def step_simulation(self):
         """Advance simulation by one time step."""
-        if self.mode != SimulationMode.SIMULATION_MODE or self.kosmos is None:
-            return
+        self.step_simulation_n(1)
+    
+    def step_simulation_n(self, n: int):
+        """
+        Advance simulation by n time steps in a single call.
         
-        self.kosmos.step(self.time_step)
-        self.time_elapsed += self.time_step
+        Kosmos is stepped n times back to back (in a single step_many call
+        when the nbody build provides one); bodies are synced and a
+        trajectory point is recorded once per batch rather than once per step.
         
-        # Update body references (Kosmos modifies the bodies)
-        updated_bodies = self.kosmos.get_bodies()
-        for i, body in enumerate(self.bodies):
-            body.nbody_body = updated_bodies[i]
-            
-            # Store position for trajectory (store every step for now)
-            self.trajectories[i].append(body.get_position())
+        Args:
+            n: Number of time steps to advance
+        """
+        if n > 0:
+            self._step_n(n)
+    
+    def _step_idle(self, n: int):
+        """Ignore step requests; there is no Kosmos in God Mode."""
+    
+    def _step_kosmos(self, n: int):
+        """Advance Kosmos by n steps and record the result (Simulation Mode)."""
+        dt = self.time_step
+        step_many = getattr(self.kosmos, 'step_many', None)
+        if step_many is not None:
+            # Whole batch inside the extension, one call for n steps
+            step_many(dt, n)
+        else:
+            step = self.kosmos.step
+            for _ in range(n):
+                step(dt)
+        self.time_elapsed += dt * n
+        
+        # Read the stepped state back into the arrays
+        self._read_kosmos()
+        
+        # Store positions for trajectories from the fresh snapshot, all
+        # bodies in one write, skipping points no body has visibly moved from
+        self.trails.append(self.positions, self.trail_min_spacing ** 2)
+        self.dirty |= POSITIONS_DIRTY
+    
+    def set_trail_length(self, length: int):
+        """
+        Change how many points each trajectory keeps.
+        
+        Existing trajectories keep their most recent points.
+        
+        Args:
+            length: Maximum number of points per body
+        """
+        self.trail_length = length
+        self.trails.resize(length)
+        self.dirty |= POSITIONS_DIRTY
+    
+    def _read_kosmos(self):
+        """
+        Copy the current Kosmos body state into the arrays, in place.
+        
+        Each nbody.Body is read exactly once, in a single pass, into one
+        (N, 5) block that the mass/position/velocity arrays are filled from.
+        """
+        rows = [(nb.get_mass(), nb.get_x(), nb.get_y(), nb.get_v_x(), nb.get_v_y())
+                for nb in self.kosmos.get_bodies()]
+        snapshot = np.array(rows, dtype=float).reshape(len(rows), 5)
+        self.masses[:] = snapshot[:, 0]
+        self.positions[:] = snapshot[:, 1:3]
+        self.velocities[:] = snapshot[:, 3:5]
+        self.positions_version += 1
     
     def clear_all(self):
         """Clear all bodies and reset state."""
+        for body in self.bodies:
+            body.detach()
         self.bodies.clear()
-        self.trajectories.clear()
+        self._next_body_num = 1
+        self.trails = TrailBuffer(self.trail_length)
+        self._body_by_id.clear()
+        self.colors.clear()
+        self._selected = None
+        self.masses = np.empty(0)
+        self.positions = np.empty((0, 2))
+        self.velocities = np.empty((0, 2))
+        self.initial_positions = np.empty((0, 2))
+        self.initial_velocities = np.empty((0, 2))
+        self._start_masses = np.empty(0)
+        self.masses_version += 1
+        self.positions_version += 1
         self.kosmos = None
         self.is_running = False
         self.time_elapsed = 0.0
         self.mode = SimulationMode.GOD_MODE
+        self._step_n = self._step_idle
+        self.dirty = ALL_DIRTY
     
     def get_time_string(self) -> str:
         """Get formatted time string."""
-        days = self.time_elapsed / 86400
-        years = days / 365.25
-        
-        if years >= 1:
-            return f"{years:.2f} years"
-        elif days >= 1:
-            return f"{days:.2f} days"
+        # Pick the unit on raw seconds, then convert only that one value
+        t = self.time_elapsed
+        if t == self._time_seconds:
+            return self._time_string
+        self._time_seconds = t
+        if t >= SECONDS_PER_YEAR:
+            value, unit = t * _PER_YEAR, "years"
+        elif t >= SECONDS_PER_DAY:
+            value, unit = t * _PER_DAY, "days"
         else:
-            hours = self.time_elapsed / 3600
-            return f"{hours:.2f} hours"
+            value, unit = t * _PER_HOUR, "hours"
+        
+        # Only reformat when the displayed hundredths actually change
+        bucket = (round(value * 100), unit)
+        if bucket != self._time_bucket:
+            self._time_bucket = bucket
+            self._time_string = f"{value:.2f} {unit}"
+        return self._time_string
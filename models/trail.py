@@ -0,0 +1,97 @@
+"""Fixed-capacity trajectory storage."""
+
+import numpy as np
+
+
+class TrailBuffer:
+    """
+    Ring buffer holding the recent (x, y) points of every body.
+
+    Bodies are rows of one (N, 2 * capacity, 2) array and are appended
+    together, so they share a single head and count. Every point is written
+    twice, at head and head + capacity, so the last `capacity` points of all
+    bodies are always one strided view of the array and drawing never has
+    to unwrap or copy the ring. Rows added mid-trail are NaN-filled, which
+    matplotlib skips when drawing.
+    """
+
+    __slots__ = ('capacity', '_buf', '_head', '_count')
+
+    def __init__(self, capacity: int, n_bodies: int = 0):
+        """
+        Initialize an empty trail buffer.
+
+        Args:
+            capacity: Maximum number of points kept per body
+            n_bodies: Number of body rows to start with
+        """
+        self.capacity = capacity
+        self._buf = np.full((n_bodies, 2 * capacity, 2), np.nan)
+        self._head = 0  # next write slot, in [0, capacity)
+        self._count = 0
+
+    def append(self, positions: np.ndarray, min_sq_dist: float = 0.0) -> bool:
+        """
+        Add one point per body, dropping the oldest ones when full.
+
+        Args:
+            positions: (N, 2) array of current positions, one row per body
+            min_sq_dist: Skip the point unless some body moved at least this
+                far (squared) from its last stored point
+
+        Returns:
+            True if the point was stored
+        """
+        head = self._head
+        if min_sq_dist > 0 and self._count and len(positions):
+            # The newest point is always at head - 1 + capacity in the
+            # doubled buffer. NaN rows compare False and never block a point.
+            step = positions - self._buf[:, head - 1 + self.capacity]
+            if np.max(np.einsum('ij,ij->i', step, step)) < min_sq_dist:
+                return False
+        self._buf[:, head] = positions
+        self._buf[:, head + self.capacity] = positions
+        self._head = head + 1 if head + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+        return True
+
+    def view(self) -> np.ndarray:
+        """Return the stored points, oldest first, as an (N, n, 2) view."""
+        if self._count < self.capacity:
+            return self._buf[:, :self._count]
+        return self._buf[:, self._head:self._head + self.capacity]
+
+    def clear(self):
+        """Forget all stored points, keeping the body rows."""
+        self._head = 0
+        self._count = 0
+
+    def reset(self, positions: np.ndarray):
+        """Restart every trail from the given (N, 2) positions."""
+        self.clear()
+        self.append(positions)
+
+    def add_rows(self, n: int):
+        """Append n body rows with empty (NaN) history."""
+        rows = np.full((n, 2 * self.capacity, 2), np.nan)
+        self._buf = np.concatenate((self._buf, rows))
+
+    def remove_row(self, index: int):
+        """Drop the trail at index, moving the last row into its place."""
+        self._buf[index] = self._buf[-1]
+        self._buf = self._buf[:-1]
+
+    def resize(self, capacity: int):
+        """Change the capacity, keeping each body's most recent points."""
+        points = self.view()[:, -capacity:]
+        n = points.shape[1]
+        self.capacity = capacity
+        self._buf = np.full((len(self._buf), 2 * capacity, 2), np.nan)
+        self._buf[:, :n] = points
+        self._buf[:, capacity:capacity + n] = points
+        self._head = n % capacity
+        self._count = n
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,55 @@
+"""Render smoke tests for SimulationCanvas."""
+
+import pytest
+
+pytest.importorskip("nbody")
+tk = pytest.importorskip("tkinter")
+
+from gui.canvas import SimulationCanvas
+from models import CelestialBody, SimulationState
+from utils import AU, EARTH_MASS, SOLAR_MASS
+
+
+@pytest.fixture
+def canvas():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display available")
+    root.withdraw()
+    canvas = SimulationCanvas(root, SimulationState())
+    yield canvas
+    root.destroy()
+
+
+def _add_bodies(state):
+    sun = CelestialBody("Sun", SOLAR_MASS, 0.0, 0.0, 0.0, 0.0, "#FDB813")
+    earth = CelestialBody("Earth", EARTH_MASS, AU, 0.0, 0.0, 29780.0, "#4A90E2")
+    state.add_bodies([sun, earth])
+    return sun, earth
+
+
+def _draw(canvas):
+    canvas.render()
+    canvas.canvas.draw()
+
+
+def test_render_empty_scene(canvas):
+    _draw(canvas)
+    assert not canvas._selection_ring.get_visible()
+
+
+def test_render_without_selection(canvas):
+    _add_bodies(canvas.state)
+    _draw(canvas)
+    assert not canvas._selection_ring.get_visible()
+    assert not canvas.velocity_arrow.get_visible()
+
+
+def test_render_with_selection(canvas):
+    _, earth = _add_bodies(canvas.state)
+    canvas.state.select_body(earth)
+    _draw(canvas)
+    assert canvas._selection_ring.get_visible()
+    assert canvas._selection_ring.center == pytest.approx((AU, 0.0))
+    assert canvas.velocity_arrow.get_visible()
@@ -0,0 +1,87 @@
+"""Tests for TrailBuffer."""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+
+# Load models/trail.py on its own; the models package imports nbody.
+_spec = importlib.util.spec_from_file_location(
+    "trail", Path(__file__).resolve().parent.parent / "models" / "trail.py"
+)
+_trail = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_trail)
+TrailBuffer = _trail.TrailBuffer
+
+
+def _points(*xs):
+    """(1, 2) position arrays for a single body at (x, 0)."""
+    return [np.array([[x, 0.0]]) for x in xs]
+
+
+def _xs(trail, row=0):
+    return trail.view()[row, :, 0].tolist()
+
+
+def test_view_before_full():
+    trail = TrailBuffer(4, n_bodies=1)
+    for p in _points(1, 2, 3):
+        trail.append(p)
+    assert len(trail) == 3
+    assert _xs(trail) == [1, 2, 3]
+
+
+def test_wrap_around_keeps_oldest_first():
+    trail = TrailBuffer(3, n_bodies=1)
+    for p in _points(1, 2, 3, 4, 5):
+        trail.append(p)
+    assert len(trail) == 3
+    assert _xs(trail) == [3, 4, 5]
+    assert trail.view().base is not None
+
+
+def test_resize_down_keeps_most_recent():
+    trail = TrailBuffer(5, n_bodies=1)
+    for p in _points(1, 2, 3, 4, 5, 6):
+        trail.append(p)
+    trail.resize(3)
+    assert _xs(trail) == [4, 5, 6]
+    trail.append(_points(7)[0])
+    assert _xs(trail) == [5, 6, 7]
+
+
+def test_resize_up_then_fill():
+    trail = TrailBuffer(3, n_bodies=1)
+    for p in _points(1, 2, 3, 4):
+        trail.append(p)
+    trail.resize(5)
+    assert _xs(trail) == [2, 3, 4]
+    for p in _points(5, 6, 7):
+        trail.append(p)
+    assert _xs(trail) == [3, 4, 5, 6, 7]
+
+
+def test_min_sq_dist_skips_small_steps():
+    trail = TrailBuffer(4, n_bodies=1)
+    assert trail.append(_points(0)[0], min_sq_dist=1.0)
+    assert not trail.append(_points(0.5)[0], min_sq_dist=1.0)
+    assert trail.append(_points(2)[0], min_sq_dist=1.0)
+    assert _xs(trail) == [0, 2]
+
+
+def test_nan_row_never_blocks():
+    trail = TrailBuffer(4, n_bodies=1)
+    trail.append(np.array([[0.0, 0.0]]))
+    trail.add_rows(1)
+    positions = np.array([[0.0, 0.0], [1.0, 1.0]])
+    assert trail.append(positions, min_sq_dist=1.0)
+    assert len(trail) == 2
+    assert np.isnan(trail.view()[1, 0]).all()
+    assert trail.view()[1, 1].tolist() == [1.0, 1.0]
+
+
+def test_remove_row_moves_last_row():
+    trail = TrailBuffer(2, n_bodies=3)
+    trail.append(np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]]))
+    trail.remove_row(0)
+    assert trail.view()[:, -1, 0].tolist() == [2.0, 1.0]
@@ -1,22 +1,34 @@
 """Utility functions and constants."""
 
 from .physics import (
+    orbital_velocity_from_mu,
     calculate_orbital_velocity, 
+    orbital_velocity_test_particle,
     calculate_escape_velocity,
     calculate_orbital_velocity_vector,
+    calculate_orbital_velocity_vectors,
     distance_between_points,
     vector_magnitude,
-    normalize_vector
+    normalize_vector,
+    normalize_vectors
 )
+from .kernels import center_of_mass, nearest_body, all_pair_distances
 from .constants import *
 
 __all__ = [
+    'orbital_velocity_from_mu',
     'calculate_orbital_velocity',
+    'orbital_velocity_test_particle',
     'calculate_escape_velocity',
     'calculate_orbital_velocity_vector',
+    'calculate_orbital_velocity_vectors',
     'distance_between_points',
     'vector_magnitude',
     'normalize_vector',
+    'normalize_vectors',
+    'center_of_mass',
+    'nearest_body',
+    'all_pair_distances',
     'G',
     'AU',
     'SOLAR_MASS',
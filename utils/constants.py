@@ -1,19 +1,21 @@
 """Physical constants for the simulation."""
 
+from typing import Final
+
 import nbody
 
 # Gravitational constant
-G = 6.67430e-11  # m^3 kg^-1 s^-2
+G: Final[float] = 6.67430e-11  # m^3 kg^-1 s^-2
 
 # Distance units
-AU = nbody.AU  # Astronomical Unit in meters
+AU: Final[float] = nbody.AU  # Astronomical Unit in meters
 
 # Common masses
-SOLAR_MASS = 1.989e30  # kg
-EARTH_MASS = 5.972e24  # kg
-JUPITER_MASS = 1.898e27  # kg
+SOLAR_MASS: Final[float] = 1.989e30  # kg
+EARTH_MASS: Final[float] = 5.972e24  # kg
+JUPITER_MASS: Final[float] = 1.898e27  # kg
 
 # Common radii (for visualization)
-SOLAR_RADIUS = 6.96e8  # meters
-EARTH_RADIUS = 6.371e6  # meters
-JUPITER_RADIUS = 6.9911e7  # meters
+SOLAR_RADIUS: Final[float] = 6.96e8  # meters
+EARTH_RADIUS: Final[float] = 6.371e6  # meters
+JUPITER_RADIUS: Final[float] = 6.9911e7  # meters
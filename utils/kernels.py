@@ -0,0 +1,59 @@
+"""Array kernels over struct-of-arrays body data."""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def center_of_mass(masses: np.ndarray, positions: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Calculate the center of mass of a set of bodies.
+    
+    Args:
+        masses: (N,) array of masses (kg)
+        positions: (N, 2) array of positions (m)
+        
+    Returns:
+        (x, y) center of mass, or None if the total mass is not positive
+    """
+    total_mass = masses.sum()
+    if total_mass <= 0:
+        return None
+    cx, cy = (masses @ positions) / total_mass
+    return (float(cx), float(cy))
+
+
+def nearest_body(positions: np.ndarray, x: float, y: float, tol2: float) -> int:
+    """
+    Find the body closest to a point, within a squared-distance tolerance.
+    
+    Args:
+        positions: (N, 2) array of positions (m)
+        x: Query x position (m)
+        y: Query y position (m)
+        tol2: Squared distance tolerance (m^2)
+        
+    Returns:
+        Index of the nearest body, or -1 if none is within the tolerance
+    """
+    if not len(positions):
+        return -1
+    offsets = positions - (x, y)
+    dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+    index = int(dist_sq.argmin())
+    return index if dist_sq[index] < tol2 else -1
+
+
+def all_pair_distances(positions: np.ndarray) -> np.ndarray:
+    """
+    Calculate the distance between every pair of bodies.
+    
+    Args:
+        positions: (N, 2) array of positions (m)
+        
+    Returns:
+        (N, N) symmetric array of distances (m), zero on the diagonal
+    """
+    positions = np.asarray(positions, dtype=float)
+    diff = positions[:, None, :] - positions[None, :, :]
+    return np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
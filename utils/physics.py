@@ -1,14 +1,34 @@
 """Physics calculations for orbital mechanics."""
 
 import math
-from typing import Tuple
+from typing import Tuple, Union
+
+import numpy as np
+
+from .constants import G as _G
+
+
+def orbital_velocity_from_mu(mu: float, distance: float) -> float:
+    """
+    Calculate circular orbital velocity from a precomputed G * (M + m).
+    
+    Args:
+        mu: Gravitational parameter G * (M + m) (m^3/s^2)
+        distance: Distance between bodies (m)
+        
+    Returns:
+        Orbital velocity in m/s
+    """
+    if distance <= 0:
+        return 0.0
+    return math.sqrt(mu / distance)
 
 
 def calculate_orbital_velocity(
     central_mass: float,
     orbiting_mass: float,
     distance: float,
-    G: float = 6.67430e-11
+    G: float = _G
 ) -> float:
     """
     Calculate circular orbital velocity for a body orbiting another.
@@ -22,21 +42,38 @@ def calculate_orbital_velocity(
     Returns:
         Orbital velocity in m/s
     """
-    if distance <= 0:
-        return 0.0
-    
     # For circular orbit: v = sqrt(G * M / r)
     # We use (M1 + M2) for accuracy, but typically M2 << M1
-    total_mass = central_mass + orbiting_mass
-    velocity = math.sqrt(G * total_mass / distance)
+    return orbital_velocity_from_mu(G * (central_mass + orbiting_mass), distance)
+
+
+def orbital_velocity_test_particle(
+    central_mass: float,
+    distance: float,
+    G: float = _G
+) -> float:
+    """
+    Calculate circular orbital velocity of a massless body.
     
-    return velocity
+    Specialization of calculate_orbital_velocity for orbiting_mass = 0.
+    
+    Args:
+        central_mass: Mass of the central body (kg)
+        distance: Distance from the central body (m)
+        G: Gravitational constant
+        
+    Returns:
+        Orbital velocity in m/s
+    """
+    if distance <= 0:
+        return 0.0
+    return math.sqrt(G * central_mass / distance)
 
 
 def calculate_escape_velocity(
     mass: float,
     distance: float,
-    G: float = 6.67430e-11
+    G: float = _G
 ) -> float:
     """
     Calculate escape velocity from a body at given distance.
@@ -63,7 +100,7 @@ def calculate_orbital_velocity_vector(
     orbiting_pos: Tuple[float, float],
     central_mass: float,
     orbiting_mass: float = 0.0,
-    G: float = 6.67430e-11,
+    G: float = _G,
     clockwise: bool = False
 ) -> Tuple[float, float]:
     """
@@ -83,7 +120,7 @@ def calculate_orbital_velocity_vector(
     # Calculate distance and direction
     dx = orbiting_pos[0] - central_pos[0]
     dy = orbiting_pos[1] - central_pos[1]
-    distance = math.sqrt(dx**2 + dy**2)
+    distance = math.hypot(dx, dy)
     
     if distance == 0:
         return (0.0, 0.0)
@@ -107,21 +144,73 @@ def calculate_orbital_velocity_vector(
     return (vx, vy)
 
 
+def calculate_orbital_velocity_vectors(
+    central_pos: Tuple[float, float],
+    orbiting_pos: np.ndarray,
+    central_mass: float,
+    orbiting_mass: Union[float, np.ndarray] = 0.0,
+    G: float = _G,
+    clockwise: bool = False
+) -> np.ndarray:
+    """
+    Calculate circular-orbit velocity vectors for many bodies at once.
+    
+    Batch form of calculate_orbital_velocity_vector for setting up several
+    bodies around the same central body.
+    
+    Args:
+        central_pos: (x, y) position of central body
+        orbiting_pos: (N, 2) array of orbiting body positions
+        central_mass: Mass of central body (kg)
+        orbiting_mass: Mass of the orbiting bodies (kg), scalar or (N,) array
+        G: Gravitational constant
+        clockwise: If True, orbit clockwise; else counter-clockwise
+        
+    Returns:
+        (N, 2) array of velocity vectors in m/s; zero for bodies sitting on
+        the central body
+    """
+    offsets = np.asarray(orbiting_pos, dtype=float).reshape(-1, 2) - central_pos
+    distance = np.hypot(offsets[:, 0], offsets[:, 1])
+    
+    # Orbital speed divided by distance, so the offsets need no normalizing
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale = np.sqrt(G * (central_mass + orbiting_mass) / distance) / distance
+    scale[distance == 0] = 0.0
+    
+    # Rotate the offsets 90 degrees (perpendicular)
+    if clockwise:
+        scale = -scale
+    velocities = np.empty_like(offsets)
+    velocities[:, 0] = -scale * offsets[:, 1]
+    velocities[:, 1] = scale * offsets[:, 0]
+    return velocities
+
+
 def distance_between_points(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
     """Calculate Euclidean distance between two points."""
     dx = p2[0] - p1[0]
     dy = p2[1] - p1[1]
-    return math.sqrt(dx**2 + dy**2)
+    return math.hypot(dx, dy)
 
 
 def vector_magnitude(vx: float, vy: float) -> float:
     """Calculate magnitude of a vector."""
-    return math.sqrt(vx**2 + vy**2)
+    return math.hypot(vx, vy)
 
 
 def normalize_vector(vx: float, vy: float) -> Tuple[float, float]:
     """Normalize a vector to unit length."""
-    mag = vector_magnitude(vx, vy)
+    mag = math.hypot(vx, vy)
     if mag == 0:
         return (0.0, 0.0)
-    return (vx / mag, vy / mag)
+    inv = 1.0 / mag
+    return (vx * inv, vy * inv)
+
+
+def normalize_vectors(vectors: np.ndarray) -> np.ndarray:
+    """Normalize an (N, 2) array of vectors to unit length; zero rows stay zero."""
+    vectors = np.asarray(vectors, dtype=float).reshape(-1, 2)
+    mag = np.hypot(vectors[:, 0], vectors[:, 1])
+    inv = np.divide(1.0, mag, out=np.zeros_like(mag), where=mag != 0)
+    return vectors * inv[:, None]